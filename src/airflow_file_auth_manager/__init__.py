@@ -6,23 +6,38 @@ A lightweight YAML file-based authentication manager that supports:
 - JWT token-based session management
 """
 
-from airflow_file_auth_manager.password import (
-    PasswordPolicyError,
-    hash_password,
-    validate_password,
-    verify_password,
-)
-from airflow_file_auth_manager.policy import FileAuthPolicy, Role
-from airflow_file_auth_manager.user import FileUser
-from airflow_file_auth_manager.user_store import UserStore
+from __future__ import annotations
 
-__version__ = "0.1.7"
+import importlib
+from typing import TYPE_CHECKING
 
-# FileAuthManager requires Airflow, so import lazily
-try:
+if TYPE_CHECKING:
     from airflow_file_auth_manager.file_auth_manager import FileAuthManager
-except ImportError:
-    FileAuthManager = None  # type: ignore[misc, assignment]
+    from airflow_file_auth_manager.password import (
+        PasswordPolicyError,
+        hash_password,
+        validate_password,
+        verify_password,
+    )
+    from airflow_file_auth_manager.policy import FileAuthPolicy, Role
+    from airflow_file_auth_manager.user import FileUser
+    from airflow_file_auth_manager.user_store import UserStore
+
+__version__ = "0.1.7"
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, e.g. for the CLI, does not pull in Airflow, bcrypt or PyYAML
+_LAZY_IMPORTS = {
+    "FileAuthManager": "airflow_file_auth_manager.file_auth_manager",
+    "FileAuthPolicy": "airflow_file_auth_manager.policy",
+    "FileUser": "airflow_file_auth_manager.user",
+    "PasswordPolicyError": "airflow_file_auth_manager.password",
+    "Role": "airflow_file_auth_manager.policy",
+    "UserStore": "airflow_file_auth_manager.user_store",
+    "hash_password": "airflow_file_auth_manager.password",
+    "validate_password": "airflow_file_auth_manager.password",
+    "verify_password": "airflow_file_auth_manager.password",
+}
 
 __all__ = [
     "FileAuthManager",
@@ -35,3 +50,24 @@ __all__ = [
     "validate_password",
     "verify_password",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        if name != "FileAuthManager":
+            raise
+        # FileAuthManager requires Airflow
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
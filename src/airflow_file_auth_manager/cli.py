@@ -8,16 +8,37 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from airflow_file_auth_manager.password import hash_password
-from airflow_file_auth_manager.user_store import UserStore
-
 if TYPE_CHECKING:
     pass
 
+# Heavy imports (PyYAML, bcrypt, Airflow) are deferred to the subcommand
+# handlers so that parsing arguments and --help stay fast
+
+ROUNDS_HELP = (
+    "bcrypt cost factor (default: 12 or AIRFLOW_FILE_AUTH_BCRYPT_ROUNDS); "
+    "use e.g. 10 for bulk imports together with rehash_on_login"
+)
+
+
+def _bcrypt_rounds(value: str) -> int:
+    """Parse --rounds, rejecting costs bcrypt does not support."""
+    from airflow_file_auth_manager.password import validate_bcrypt_rounds
+
+    try:
+        rounds = int(value)
+    except ValueError:
+        rounds = value
+    try:
+        return validate_bcrypt_rounds(rounds)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
 
 def add_user(args: argparse.Namespace) -> None:
     """Add a new user to the users file."""
-    store = UserStore(args.file)
+    from airflow_file_auth_manager.user_store import UserStore
+
+    store = UserStore(args.file, bcrypt_rounds=args.rounds)
 
     # Get password interactively if not provided
     password = args.password
@@ -50,7 +71,9 @@ def add_user(args: argparse.Namespace) -> None:
 
 def update_user(args: argparse.Namespace) -> None:
     """Update an existing user."""
-    store = UserStore(args.file)
+    from airflow_file_auth_manager.user_store import UserStore
+
+    store = UserStore(args.file, bcrypt_rounds=args.rounds)
 
     # Get password interactively if flag is set
     password = None
@@ -80,6 +103,8 @@ def update_user(args: argparse.Namespace) -> None:
 
 def delete_user(args: argparse.Namespace) -> None:
     """Delete a user."""
+    from airflow_file_auth_manager.user_store import UserStore
+
     store = UserStore(args.file)
 
     if not args.yes:
@@ -99,6 +124,8 @@ def delete_user(args: argparse.Namespace) -> None:
 
 def list_users(args: argparse.Namespace) -> None:
     """List all users."""
+    from airflow_file_auth_manager.user_store import UserStore
+
     store = UserStore(args.file)
     users = store.get_all_users()
 
@@ -119,6 +146,8 @@ def list_users(args: argparse.Namespace) -> None:
 
 def hash_password_cmd(args: argparse.Namespace) -> None:
     """Generate a password hash."""
+    from airflow_file_auth_manager.password import hash_password
+
     password = args.password
     if not password:
         password = getpass.getpass("Password: ")
@@ -127,7 +156,7 @@ def hash_password_cmd(args: argparse.Namespace) -> None:
         print("Error: Password cannot be empty", file=sys.stderr)
         sys.exit(1)
 
-    hashed = hash_password(password)
+    hashed = hash_password(password, rounds=args.rounds)
     print(hashed)
 
 
@@ -153,7 +182,9 @@ def init_file(args: argparse.Namespace) -> None:
         print("Error: Password cannot be empty", file=sys.stderr)
         sys.exit(1)
 
-    store = UserStore(file_path)
+    from airflow_file_auth_manager.user_store import UserStore
+
+    store = UserStore(file_path, bcrypt_rounds=args.rounds)
     store.add_user(
         username="admin",
         password=password,
@@ -165,6 +196,34 @@ def init_file(args: argparse.Namespace) -> None:
     print("Admin user created with username 'admin'")
 
 
+def migrate_file(args: argparse.Namespace) -> None:
+    """Convert a YAML users file to JSON."""
+    source_path = Path(args.file)
+    output_path = Path(args.output) if args.output else source_path.with_suffix(".json")
+
+    if not source_path.exists():
+        print(f"Error: File not found: {source_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if output_path.exists() and not args.force:
+        print(f"Error: File already exists: {output_path}", file=sys.stderr)
+        print("Use --force to overwrite", file=sys.stderr)
+        sys.exit(1)
+
+    from airflow_file_auth_manager.user_store import UserStore
+
+    source = UserStore(source_path)
+    # load() logs and leaves the store empty on read or parse errors; never
+    # write an empty file that would lock everyone out
+    if not source.get_all_users():
+        print(f"Error: No users could be loaded from {source_path}", file=sys.stderr)
+        print("Check the file for YAML errors; nothing was written", file=sys.stderr)
+        sys.exit(1)
+
+    target = source.export(output_path)
+    print(f"Migrated {len(target.get_all_users())} user(s) to {output_path}")
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -185,6 +244,7 @@ def create_parser() -> argparse.ArgumentParser:
         choices=["admin", "editor", "viewer"],
         help="User role",
     )
+    add_parser.add_argument("--rounds", type=_bcrypt_rounds, help=ROUNDS_HELP)
     add_parser.add_argument("-e", "--email", help="Email address")
     add_parser.add_argument("--firstname", help="First name")
     add_parser.add_argument("--lastname", help="Last name")
@@ -204,6 +264,7 @@ def create_parser() -> argparse.ArgumentParser:
     update_parser.add_argument("--firstname", help="New first name")
     update_parser.add_argument("--lastname", help="New last name")
     update_parser.add_argument("--active", type=lambda x: x.lower() == "true", help="Set active status (true/false)")
+    update_parser.add_argument("--rounds", type=_bcrypt_rounds, help=ROUNDS_HELP)
     update_parser.set_defaults(func=update_user)
 
     # delete-user command
@@ -221,6 +282,7 @@ def create_parser() -> argparse.ArgumentParser:
     # hash-password command
     hash_parser = subparsers.add_parser("hash-password", help="Generate bcrypt password hash")
     hash_parser.add_argument("-p", "--password", help="Password to hash (will prompt if not provided)")
+    hash_parser.add_argument("--rounds", type=_bcrypt_rounds, help=ROUNDS_HELP)
     hash_parser.set_defaults(func=hash_password_cmd)
 
     # init command
@@ -229,8 +291,16 @@ def create_parser() -> argparse.ArgumentParser:
     init_parser.add_argument("-p", "--password", help="Admin password (will prompt if not provided)")
     init_parser.add_argument("-e", "--email", help="Admin email")
     init_parser.add_argument("--force", action="store_true", help="Overwrite existing file")
+    init_parser.add_argument("--rounds", type=_bcrypt_rounds, help=ROUNDS_HELP)
     init_parser.set_defaults(func=init_file)
 
+    # migrate command
+    migrate_parser = subparsers.add_parser("migrate", help="Convert a YAML users file to JSON")
+    migrate_parser.add_argument("-f", "--file", required=True, help="Path to existing users YAML file")
+    migrate_parser.add_argument("-o", "--output", help="Path for JSON file (default: same name with .json)")
+    migrate_parser.add_argument("--force", action="store_true", help="Overwrite existing file")
+    migrate_parser.set_defaults(func=migrate_file)
+
     return parser
 
 
@@ -246,8 +316,8 @@ def main(args: list[str] | None = None) -> None:
     parsed_args.func(parsed_args)
 
 
-# Airflow plugin for CLI integration (optional)
-try:
+def _create_plugin_class() -> type:
+    """Build the Airflow plugin class (imports Airflow)."""
     from airflow.plugins_manager import AirflowPlugin
 
     class FileAuthCLIPlugin(AirflowPlugin):
@@ -257,9 +327,21 @@ try:
         # Note: Airflow 3.x CLI plugin registration differs from 2.x
         # For now, the CLI can be used directly via `python -m airflow_file_auth_manager.cli`
 
-except ImportError:
-    # Airflow not installed, CLI can still be used standalone
-    pass
+    return FileAuthCLIPlugin
+
+
+def __getattr__(name: str) -> object:
+    # Airflow plugin for CLI integration (optional), created on first access so
+    # that standalone CLI usage never imports Airflow
+    if name == "FileAuthCLIPlugin":
+        try:
+            plugin_class = _create_plugin_class()
+        except ImportError:
+            # Airflow not installed, CLI can still be used standalone
+            raise AttributeError(name) from None
+        globals()[name] = plugin_class
+        return plugin_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
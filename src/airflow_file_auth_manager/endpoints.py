@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
@@ -13,7 +19,12 @@ from jinja2 import Environment, FileSystemLoader
 
 from airflow.configuration import conf
 
-from airflow_file_auth_manager.password import verify_password
+from airflow_file_auth_manager.file_auth_manager import CONFIG_SECTION
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from airflow_file_auth_manager.file_auth_manager import FileAuthManager
@@ -24,6 +35,80 @@ logger = logging.getLogger(__name__)
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Prefer orjson for request bodies when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Threads available for password verification. bcrypt releases the GIL, so
+# verification scales with cores
+DEFAULT_AUTH_WORKERS = os.cpu_count() or 4
+
+# Login forms only carry username, password and next, so much larger bodies
+# are rejected before they are buffered or parsed
+MAX_FORM_BODY_SIZE = 64 * 1024
+MAX_FORM_FIELDS = 16
+
+
+class _JSONResponse(JSONResponse):
+    """JSONResponse serialized with orjson when it is installed.
+
+    FastAPI's ORJSONResponse is deprecated and requires orjson, so this keeps
+    the stdlib encoder as a fallback.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+@functools.cache
+def _get_jwt_expiration() -> int:
+    """Return the JWT expiration from config, read once per process."""
+    return conf.getint("api_auth", "jwt_expiration_seconds", fallback=36000)
+
+
+def _client_host(request: Request) -> str:
+    """Return the client IP for audit logs."""
+    client = request.client
+    return client.host if client else "unknown"
+
+
+async def _read_form_body(request: Request) -> bytes | None:
+    """Return the request body, or None if it exceeds MAX_FORM_BODY_SIZE."""
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > MAX_FORM_BODY_SIZE:
+        return None
+    # Content-Length may be missing or wrong, so count what is actually read
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_FORM_BODY_SIZE:
+            return None
+    return bytes(body)
+
+
+def _parse_form(body: bytes) -> dict[str, str] | None:
+    """Parse a login form, or return None if it has too many or repeated fields."""
+    try:
+        fields = parse_qsl(
+            body.decode("utf-8", "replace"),
+            keep_blank_values=True,
+            max_num_fields=MAX_FORM_FIELDS,
+        )
+    except ValueError:
+        return None
+    form_data = dict(fields)
+    # A repeated field would otherwise silently resolve to its last value
+    return form_data if len(form_data) == len(fields) else None
+
+
+def _is_secure_request(request: Request) -> bool:
+    """Detect if the request was made over HTTPS."""
+    return (
+        request.url.scheme == "https"
+        or request.headers.get("x-forwarded-proto") == "https"
+    )
+
 
 def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
     """Create FastAPI app with authentication endpoints.
@@ -37,6 +122,7 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
     app = FastAPI(
         title="File Auth Manager",
         description="YAML file-based authentication for Apache Airflow",
+        default_response_class=_JSONResponse,
     )
 
     # Setup Jinja2 templates
@@ -44,19 +130,33 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=True,
     )
+    login_template = jinja_env.get_template("login.html")
+    # The common case (no error, default redirect) always renders the same page
+    default_login_html = login_template.render(next_url="/", error=None).encode("utf-8")
 
     # Mount static files if directory exists
     if STATIC_DIR.exists():
         app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
+    user_store = auth_manager.user_store
+
     # Get JWT expiration from config
-    jwt_expiration = conf.getint("api_auth", "jwt_expiration_seconds", fallback=36000)
+    jwt_expiration = _get_jwt_expiration()
+
+    # Dedicated pool so login bursts neither block the event loop nor starve
+    # Airflow's default executor
+    auth_workers = conf.getint(CONFIG_SECTION, "auth_workers", fallback=DEFAULT_AUTH_WORKERS)
+    auth_executor = ThreadPoolExecutor(
+        max_workers=max(1, auth_workers),
+        thread_name_prefix="file-auth",
+    )
 
     @app.get("/login", response_class=HTMLResponse)
     async def login_page(request: Request, next: str | None = None, error: str | None = None) -> HTMLResponse:
         """Render the login page."""
-        template = jinja_env.get_template("login.html")
-        html = template.render(
+        if error is None and (next or "/") == "/":
+            return HTMLResponse(content=default_login_html)
+        html = login_template.render(
             next_url=next or "/",
             error=error,
         )
@@ -75,26 +175,40 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
         - Browser sessions: HttpOnly cookies (protected from XSS)
         - API clients: Bearer tokens in response body (use Authorization header)
         """
-        # Handle request based on content type
-        content_type = request.headers.get("content-type", "")
-        is_form_submission = "application/x-www-form-urlencoded" in content_type
+        # Handle request based on content type, reading the body only once
+        content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+        is_form_submission = content_type == "application/x-www-form-urlencoded"
         username: str | None = None
         password: str | None = None
-        form_data = None
+        form_data: dict[str, str] = {}
 
-        if "application/json" in content_type:
+        if content_type == "application/json":
             try:
-                body = await request.json()
+                body = _json_loads(await request.body())
                 username = body.get("username")
                 password = body.get("password")
             except Exception as e:
                 logger.error("Failed to parse JSON body: %s", e)
-                return JSONResponse(
+                return _JSONResponse(
                     status_code=400,
                     content={"error": f"Invalid JSON body: {e}"},
                 )
         elif is_form_submission:
-            form_data = await request.form()
+            raw_body = await _read_form_body(request)
+            if raw_body is None:
+                logger.warning("AUDIT: Login form body too large (IP: %s)", _client_host(request))
+                return _JSONResponse(
+                    status_code=413,
+                    content={"error": "Request body too large"},
+                )
+            parsed = _parse_form(raw_body)
+            if parsed is None:
+                logger.warning("AUDIT: Malformed login form (IP: %s)", _client_host(request))
+                return _JSONResponse(
+                    status_code=400,
+                    content={"error": "Invalid form body"},
+                )
+            form_data = parsed
             username = form_data.get("username")
             password = form_data.get("password")
 
@@ -106,22 +220,24 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
                     url="/auth/login?error=Username+and+password+required",
                     status_code=303,
                 )
-            return JSONResponse(
+            return _JSONResponse(
                 status_code=400,
                 content={"error": "Username and password required"},
             )
 
-        # Authenticate user
-        user = auth_manager.user_store.authenticate(username, password)
+        # Authenticate user off the event loop (bcrypt is CPU-bound)
+        user = await asyncio.get_running_loop().run_in_executor(
+            auth_executor, user_store.authenticate, username, password
+        )
         if not user:
             logger.warning("AUDIT: Failed login attempt for user: %s (IP: %s)",
-                          username, request.client.host if request.client else "unknown")
+                          username, _client_host(request))
             if is_form_submission:
                 return RedirectResponse(
                     url="/auth/login?error=Invalid+username+or+password",
                     status_code=303,
                 )
-            return JSONResponse(
+            return _JSONResponse(
                 status_code=401,
                 content={"error": "Invalid username or password"},
             )
@@ -130,33 +246,26 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
         token = auth_manager.generate_jwt(user, expiration_time_in_seconds=jwt_expiration)
 
         logger.info("AUDIT: User logged in: %s (IP: %s)",
-                   username, request.client.host if request.client else "unknown")
+                   username, _client_host(request))
 
         # Form submission - set HttpOnly cookie and redirect
         if is_form_submission:
-            # form_data was already read above
-            next_url = form_data.get("next", "/") if form_data else "/"
-
-            # Detect if using HTTPS
-            is_secure = (
-                request.url.scheme == "https"
-                or request.headers.get("x-forwarded-proto") == "https"
-            )
+            next_url = form_data.get("next", "/")
 
-            redirect_response = RedirectResponse(url=str(next_url), status_code=303)
+            redirect_response = RedirectResponse(url=next_url, status_code=303)
             redirect_response.set_cookie(
                 key="_token",
                 value=token,
                 max_age=jwt_expiration,
                 httponly=True,  # Protect from XSS attacks
-                secure=is_secure,
+                secure=_is_secure_request(request),
                 samesite="lax",
             )
             return redirect_response
 
         # JSON API - return token in response body
         # Client should use this token in Authorization header: "Bearer <token>"
-        return JSONResponse(
+        return _JSONResponse(
             content={
                 "access_token": token,
                 "token_type": "Bearer",
@@ -167,8 +276,7 @@ def create_auth_app(auth_manager: FileAuthManager) -> FastAPI:
     @app.get("/logout")
     async def logout(request: Request) -> RedirectResponse:
         """Log out user by clearing JWT cookie."""
-        logger.info("AUDIT: User logged out (IP: %s)",
-                   request.client.host if request.client else "unknown")
+        logger.info("AUDIT: User logged out (IP: %s)", _client_host(request))
 
         redirect_response = RedirectResponse(url="/auth/login", status_code=303)
         redirect_response.delete_cookie(key="_token")
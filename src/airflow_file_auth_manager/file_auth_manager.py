@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 from functools import cached_property
+from itertools import repeat
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Sequence
+from urllib.parse import quote_plus
 
 from airflow.api_fastapi.auth.managers.base_auth_manager import BaseAuthManager, ResourceMethod, MenuItem
 from airflow.configuration import conf
 
-from airflow_file_auth_manager.policy import FileAuthPolicy, Role
+from airflow_file_auth_manager.password import BCRYPT_ROUNDS
+from airflow_file_auth_manager.policy import FileAuthPolicy, Permission, Role
 from airflow_file_auth_manager.user import FileUser
 from airflow_file_auth_manager.user_store import UserStore
 
@@ -36,6 +40,49 @@ logger = logging.getLogger(__name__)
 CONFIG_SECTION = "file_auth_manager"
 
 
+def _build_permission_table() -> dict[tuple[str, str, str], bool]:
+    """Precompute (role, method, resource) decisions from FileAuthPolicy.
+
+    The policy only depends on role and method for these resources, so every
+    decision can be evaluated once up front. Unknown roles or methods are
+    absent from the table and therefore denied.
+    """
+    checks = {
+        "configuration": FileAuthPolicy.is_authorized_configuration,
+        "connection": FileAuthPolicy.is_authorized_connection,
+        "dag": FileAuthPolicy.is_authorized_dag,
+        "asset": FileAuthPolicy.is_authorized_dataset,
+        "pool": FileAuthPolicy.is_authorized_pool,
+        "variable": FileAuthPolicy.is_authorized_variable,
+    }
+    return {
+        (role.value, method.value, resource): check(method=method.value, user_role=role.value)
+        for resource, check in checks.items()
+        for role in Role
+        for method in Permission
+    }
+
+
+def _build_allowed_methods(
+    table: dict[tuple[str, str, str], bool],
+) -> dict[tuple[str, str], frozenset[str]]:
+    """Group a permission table into the methods allowed per (role, resource)."""
+    allowed: dict[tuple[str, str], set[str]] = {}
+    for (role, method, resource), decision in table.items():
+        methods = allowed.setdefault((role, resource), set())
+        if decision:
+            methods.add(method)
+    return {key: frozenset(methods) for key, methods in allowed.items()}
+
+
+_PERMISSION_TABLE = _build_permission_table()
+_ALLOWED_METHODS = _build_allowed_methods(_PERMISSION_TABLE)
+
+# Accessors for batch request dicts
+_get_user = itemgetter("user")
+_get_method = itemgetter("method")
+
+
 class FileAuthManager(BaseAuthManager[FileUser]):
     """YAML file-based authentication manager for Apache Airflow.
 
@@ -45,23 +92,39 @@ class FileAuthManager(BaseAuthManager[FileUser]):
     - JWT token-based session management
     """
 
+    # Menu items that require admin role (case-insensitive)
+    ADMIN_ONLY_MENUS = frozenset({
+        "connections",
+        "variables",
+        "pools",
+        "config",
+        "admin",
+    })
+
     def __init__(self) -> None:
         """Initialize FileAuthManager."""
         super().__init__()
-        self._user_store: UserStore | None = None
 
     @cached_property
     def user_store(self) -> UserStore:
         """Get the user store instance."""
         users_file = conf.get(CONFIG_SECTION, "users_file", fallback=None)
-        return UserStore(users_file)
+        return UserStore(
+            users_file,
+            bcrypt_rounds=conf.getint(CONFIG_SECTION, "bcrypt_rounds", fallback=BCRYPT_ROUNDS),
+            rehash_on_login=conf.getboolean(CONFIG_SECTION, "rehash_on_login", fallback=False),
+            watch=conf.getboolean(CONFIG_SECTION, "watch_users_file", fallback=True),
+        )
 
     def init(self) -> None:
         """Initialize the auth manager."""
         logger.info("Initializing FileAuthManager")
+        # Resolve the store at startup so request paths find it in the instance
+        # __dict__ and never take cached_property's first-access lock
+        user_store = self.user_store
         # Pre-load users
-        self.user_store.load()
-        user_count = len(self.user_store.get_all_users())
+        user_store.load()
+        user_count = len(user_store.get_all_users())
         logger.info("FileAuthManager initialized with %d users", user_count)
 
     def is_logged_in(self) -> bool:
@@ -88,12 +151,10 @@ class FileAuthManager(BaseAuthManager[FileUser]):
 
     def get_url_login(self, **kwargs) -> str:
         """Get the login page URL."""
-        from urllib.parse import urlencode
-        url = "/auth/login"
         next_url = kwargs.get("next_url")
         if next_url:
-            url = f"{url}?{urlencode({'next': next_url})}"
-        return url
+            return f"/auth/login?next={quote_plus(str(next_url))}"
+        return "/auth/login"
 
     def get_url_logout(self) -> str:
         """Get the logout URL."""
@@ -140,13 +201,18 @@ class FileAuthManager(BaseAuthManager[FileUser]):
 
     # =========================================================================
     # Authorization Methods
+    #
+    # Each is_authorized_* indexes _PERMISSION_TABLE directly, keeping the
+    # per-check cost to one role read and one dict lookup
     # =========================================================================
 
     def _get_user_role(self, user: FileUser | None) -> str:
-        """Get role for given user."""
-        if user and isinstance(user, FileUser):
-            return user.role
-        return "viewer"  # Default to most restrictive
+        """Get role for given user, defaulting to the most restrictive role.
+
+        The user was already resolved against the store by deserialize_user,
+        so this is a plain attribute read and needs no per-request caching.
+        """
+        return getattr(user, "role", None) or "viewer"
 
     def is_authorized_configuration(
         self,
@@ -156,11 +222,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: ConfigurationDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access configuration."""
-        return FileAuthPolicy.is_authorized_configuration(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "configuration"), False)
 
     def is_authorized_connection(
         self,
@@ -170,11 +232,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: ConnectionDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access connections."""
-        return FileAuthPolicy.is_authorized_connection(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "connection"), False)
 
     def is_authorized_dag(
         self,
@@ -185,12 +243,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: DagDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access Dags."""
-        return FileAuthPolicy.is_authorized_dag(
-            method=method,
-            user_role=self._get_user_role(user),
-            access_entity=access_entity,
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "dag"), False)
 
     def is_authorized_asset(
         self,
@@ -200,11 +253,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: AssetDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access assets (datasets)."""
-        return FileAuthPolicy.is_authorized_dataset(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "asset"), False)
 
     def is_authorized_asset_alias(
         self,
@@ -214,11 +263,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: AssetAliasDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access asset aliases."""
-        return FileAuthPolicy.is_authorized_dataset(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "asset"), False)
 
     def is_authorized_backfill(
         self,
@@ -228,11 +273,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: BackfillDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access backfills."""
-        return FileAuthPolicy.is_authorized_dag(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "dag"), False)
 
     def is_authorized_pool(
         self,
@@ -242,11 +283,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: PoolDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access pools."""
-        return FileAuthPolicy.is_authorized_pool(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "pool"), False)
 
     def is_authorized_variable(
         self,
@@ -256,11 +293,7 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         details: VariableDetails | None = None,
     ) -> bool:
         """Check if user is authorized to access variables."""
-        return FileAuthPolicy.is_authorized_variable(
-            method=method,
-            user_role=self._get_user_role(user),
-            details=details,
-        )
+        return _PERMISSION_TABLE.get((self._get_user_role(user), method, "variable"), False)
 
     def is_authorized_view(
         self,
@@ -292,62 +325,65 @@ class FileAuthManager(BaseAuthManager[FileUser]):
     # Batch Authorization Methods
     # =========================================================================
 
+    def _batch_is_authorized(
+        self,
+        resource: str,
+        requests: Sequence[dict[str, Any]],
+        user: FileUser | None,
+    ) -> bool:
+        """Check all requests against the permission table for one resource.
+
+        Airflow passes a single ``user`` for the whole batch, so its role is
+        resolved once and each request is a set membership test. Requests
+        carrying their own ``user`` key are checked individually.
+        """
+        if user is not None:
+            allowed = _ALLOWED_METHODS.get((self._get_user_role(user), resource), frozenset())
+            return all(map(allowed.__contains__, map(_get_method, requests)))
+
+        keys = zip(
+            map(self._get_user_role, map(_get_user, requests)),
+            map(_get_method, requests),
+            repeat(resource),
+        )
+        # Missing keys yield None, which all() treats as denied
+        return all(map(_PERMISSION_TABLE.get, keys))
+
     def batch_is_authorized_connection(
         self,
         requests: Sequence[dict[str, Any]],
+        *,
+        user: FileUser | None = None,
     ) -> bool:
         """Batch check connection authorization."""
-        return all(
-            self.is_authorized_connection(
-                method=req["method"],
-                user=req["user"],
-                details=req.get("details"),
-            )
-            for req in requests
-        )
+        return self._batch_is_authorized("connection", requests, user)
 
     def batch_is_authorized_dag(
         self,
         requests: Sequence[dict[str, Any]],
+        *,
+        user: FileUser | None = None,
     ) -> bool:
         """Batch check Dag authorization."""
-        return all(
-            self.is_authorized_dag(
-                method=req["method"],
-                user=req["user"],
-                access_entity=req.get("access_entity"),
-                details=req.get("details"),
-            )
-            for req in requests
-        )
+        return self._batch_is_authorized("dag", requests, user)
 
     def batch_is_authorized_pool(
         self,
         requests: Sequence[dict[str, Any]],
+        *,
+        user: FileUser | None = None,
     ) -> bool:
         """Batch check pool authorization."""
-        return all(
-            self.is_authorized_pool(
-                method=req["method"],
-                user=req["user"],
-                details=req.get("details"),
-            )
-            for req in requests
-        )
+        return self._batch_is_authorized("pool", requests, user)
 
     def batch_is_authorized_variable(
         self,
         requests: Sequence[dict[str, Any]],
+        *,
+        user: FileUser | None = None,
     ) -> bool:
         """Batch check variable authorization."""
-        return all(
-            self.is_authorized_variable(
-                method=req["method"],
-                user=req["user"],
-                details=req.get("details"),
-            )
-            for req in requests
-        )
+        return self._batch_is_authorized("variable", requests, user)
 
     # =========================================================================
     # Menu Filtering
@@ -364,32 +400,21 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         Hides menu items that the user doesn't have permission to access,
         providing a cleaner UX.
         """
-        user_role = self._get_user_role(user)
-
-        # Menu items that require admin role (case-insensitive)
-        admin_only_menus = frozenset({
-            "connections",
-            "variables",
-            "pools",
-            "config",
-            "admin",
-        })
-
-        filtered = []
-        for item in menu_items:
-            # MenuItem is an enum, get its name
-            item_name = item.name.lower() if hasattr(item, 'name') else str(item).lower()
-
-            # Check admin-only menus
-            if item_name in admin_only_menus:
-                if FileAuthPolicy.has_minimum_role(user_role, Role.ADMIN):
-                    filtered.append(item)
-                continue
-
-            # Default: allow all other menu items for all roles
-            filtered.append(item)
-
-        return filtered
+        if FileAuthPolicy.has_minimum_role(self._get_user_role(user), Role.ADMIN):
+            return list(menu_items)
+
+        # MenuItem members are matched by identity; anything else (plugin
+        # items, plain strings) falls back to a case-insensitive name check
+        admin_only_names = self.ADMIN_ONLY_MENUS
+        return [
+            item
+            for item in menu_items
+            if item not in _ADMIN_ONLY_MENU_ITEMS
+            and (
+                isinstance(item, MenuItem)
+                or str(getattr(item, "name", item)).lower() not in admin_only_names
+            )
+        ]
 
     # =========================================================================
     # FastAPI Integration
@@ -400,3 +425,9 @@ class FileAuthManager(BaseAuthManager[FileUser]):
         from airflow_file_auth_manager.endpoints import create_auth_app
 
         return create_auth_app(self)
+
+
+# MenuItem members hidden from non-admins, resolved once from the names above
+_ADMIN_ONLY_MENU_ITEMS = frozenset(
+    item for item in MenuItem if item.name.lower() in FileAuthManager.ADMIN_ONLY_MENUS
+)
@@ -2,14 +2,61 @@
 
 from __future__ import annotations
 
-import re
+import hashlib
+import hmac
+import logging
+import os
+import string
+import threading
+import time
+from collections import OrderedDict
+from functools import reduce
+from operator import or_
 
 import bcrypt
 
+logger = logging.getLogger(__name__)
+
 # Password policy constants
 MIN_PASSWORD_LENGTH = 8
 MAX_PASSWORD_LENGTH = 128
 
+# Character classes required by the policy. A password is classified in C by
+# translating its ASCII bytes through a 256-entry table; only digits also have
+# non-ASCII members (any Unicode decimal digit, as matched by the regex \d)
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGIT = frozenset(string.digits)
+_SPECIAL = frozenset("!@#$%^&*(),.?\":{}|<>_-+=[]\\;'/`~")
+_CHAR_CLASSES = (
+    (_UPPER, "Password must contain at least one uppercase letter"),
+    (_LOWER, "Password must contain at least one lowercase letter"),
+    (_DIGIT, "Password must contain at least one digit"),
+    (_SPECIAL, "Password must contain at least one special character"),
+)
+_ALL_CLASSES = (1 << len(_CHAR_CLASSES)) - 1
+_DIGIT_BIT = 1 << 2  # position of _DIGIT in _CHAR_CLASSES
+_CLASS_TABLE = bytes(
+    next((1 << i for i, (chars, _) in enumerate(_CHAR_CLASSES) if chr(code) in chars), 0)
+    for code in range(256)
+)
+
+# bcrypt cost factor (2^rounds key expansions), overridable via environment
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 31
+BCRYPT_ROUNDS_ENV = "AIRFLOW_FILE_AUTH_BCRYPT_ROUNDS"
+
+# Successful verifications are cached to skip repeated bcrypt runs
+VERIFY_CACHE_MAX_SIZE = 1024
+VERIFY_CACHE_TTL = 300.0
+
+# HMAC(password|hash) -> expires_at. Keyed with a per-process secret so the
+# cache never holds anything usable as a password oracle
+_verify_cache: OrderedDict[bytes, float] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+_VERIFY_CACHE_SECRET = os.urandom(32)
+
 
 class PasswordPolicyError(ValueError):
     """Raised when password doesn't meet policy requirements."""
@@ -44,25 +91,76 @@ def validate_password(password: str) -> None:
             f"Password must be at most {MAX_PASSWORD_LENGTH} characters long"
         )
 
-    if not re.search(r"[A-Z]", password):
-        raise PasswordPolicyError("Password must contain at least one uppercase letter")
+    # Bit i is set if any character belongs to _CHAR_CLASSES[i]
+    classes = password.encode("ascii", "ignore").translate(_CLASS_TABLE)
+    found = reduce(or_, set(classes), 0)
+    if not found & _DIGIT_BIT and not password.isascii() and any(
+        c.isdecimal() for c in password
+    ):
+        found |= _DIGIT_BIT
+    if found == _ALL_CLASSES:
+        return
+
+    for i, (_, message) in enumerate(_CHAR_CLASSES):
+        if not found & (1 << i):
+            raise PasswordPolicyError(message)
+
+
+def validate_bcrypt_rounds(rounds: int) -> int:
+    """Check that rounds is a cost factor bcrypt accepts.
+
+    Args:
+        rounds: bcrypt cost factor.
+
+    Returns:
+        The validated cost factor.
+
+    Raises:
+        ValueError: If rounds is outside MIN_BCRYPT_ROUNDS..MAX_BCRYPT_ROUNDS.
+    """
+    if isinstance(rounds, bool) or not isinstance(rounds, int) or not (
+        MIN_BCRYPT_ROUNDS <= rounds <= MAX_BCRYPT_ROUNDS
+    ):
+        raise ValueError(
+            f"bcrypt rounds must be an integer between {MIN_BCRYPT_ROUNDS} and "
+            f"{MAX_BCRYPT_ROUNDS}, got {rounds!r}"
+        )
+    return rounds
+
 
-    if not re.search(r"[a-z]", password):
-        raise PasswordPolicyError("Password must contain at least one lowercase letter")
+def _resolve_bcrypt_rounds() -> int:
+    """Read the bcrypt cost factor from the environment."""
+    value = os.environ.get(BCRYPT_ROUNDS_ENV)
+    if not value:
+        return DEFAULT_BCRYPT_ROUNDS
+    try:
+        rounds = int(value)
+    except ValueError:
+        rounds = 0
+    if not MIN_BCRYPT_ROUNDS <= rounds <= MAX_BCRYPT_ROUNDS:
+        logger.warning(
+            "Invalid %s=%r, using default of %d",
+            BCRYPT_ROUNDS_ENV,
+            value,
+            DEFAULT_BCRYPT_ROUNDS,
+        )
+        return DEFAULT_BCRYPT_ROUNDS
+    return rounds
 
-    if not re.search(r"\d", password):
-        raise PasswordPolicyError("Password must contain at least one digit")
 
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>_\-+=\[\]\\;'/`~]", password):
-        raise PasswordPolicyError("Password must contain at least one special character")
+# Resolved once at import so hashing never re-reads the environment
+BCRYPT_ROUNDS = _resolve_bcrypt_rounds()
 
 
-def hash_password(password: str, validate: bool = True) -> str:
+def hash_password(
+    password: str | bytes, validate: bool = True, rounds: int | None = None
+) -> str:
     """Hash a password using bcrypt.
 
     Args:
-        password: Plain text password to hash.
+        password: Plain text password to hash, as str or UTF-8 bytes.
         validate: Whether to validate password against policy (default: True).
+        rounds: bcrypt cost factor. Defaults to BCRYPT_ROUNDS.
 
     Returns:
         Bcrypt hash string.
@@ -70,25 +168,91 @@ def hash_password(password: str, validate: bool = True) -> str:
     Raises:
         PasswordPolicyError: If validate=True and password doesn't meet policy.
     """
-    if validate:
-        validate_password(password)
+    if isinstance(password, str):
+        if validate:
+            validate_password(password)
+        password = password.encode("utf-8")
+    elif validate:
+        validate_password(password.decode("utf-8"))
+
+    salt = bcrypt.gensalt(rounds=rounds or BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password, salt).decode("ascii")
+
+
+def get_hash_rounds(password_hash: str) -> int | None:
+    """Return the cost factor of a bcrypt hash, or None if it is malformed."""
+    # Format: $2b$<cost>$<salt+digest>
+    parts = password_hash.split("$", 3)
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(password_hash: str, rounds: int | None = None) -> bool:
+    """Check whether a hash was created with a lower cost than configured.
+
+    Args:
+        password_hash: Bcrypt hash to inspect.
+        rounds: Target cost factor. Defaults to BCRYPT_ROUNDS.
+
+    Returns:
+        True if the hash should be regenerated at the target cost.
+    """
+    current = get_hash_rounds(password_hash)
+    return current is not None and current < (rounds or BCRYPT_ROUNDS)
+
+
+def _verify_cache_key(password: bytes, password_hash: bytes) -> bytes:
+    """Build the verification cache key for a password/hash pair."""
+    return hmac.new(
+        _VERIFY_CACHE_SECRET, password + b"|" + password_hash, hashlib.sha256
+    ).digest()
+
 
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+def clear_verify_cache() -> None:
+    """Drop all cached password verifications."""
+    with _verify_cache_lock:
+        _verify_cache.clear()
 
 
-def verify_password(password: str, password_hash: str) -> bool:
+def verify_password(password: str | bytes, password_hash: str | bytes) -> bool:
     """Verify a password against a bcrypt hash.
 
+    Both arguments may be passed pre-encoded to skip per-call encoding.
+    Successful matches are cached for VERIFY_CACHE_TTL seconds; failures
+    always run bcrypt.
+
     Args:
-        password: Plain text password to verify.
-        password_hash: Bcrypt hash to check against.
+        password: Plain text password to verify, as str or UTF-8 bytes.
+        password_hash: Bcrypt hash to check against, as str or bytes.
 
     Returns:
         True if password matches, False otherwise.
     """
     try:
-        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+        if isinstance(password, str):
+            password = password.encode("utf-8")
+        if isinstance(password_hash, str):
+            password_hash = password_hash.encode("ascii")
+        key = _verify_cache_key(password, password_hash)
+        now = time.monotonic()
+
+        with _verify_cache_lock:
+            expires_at = _verify_cache.get(key)
+            if expires_at is not None:
+                if expires_at > now:
+                    _verify_cache.move_to_end(key)
+                    return True
+                del _verify_cache[key]
+
+        if not bcrypt.checkpw(password, password_hash):
+            return False
     except (ValueError, TypeError):
         return False
+
+    with _verify_cache_lock:
+        _verify_cache[key] = now + VERIFY_CACHE_TTL
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > VERIFY_CACHE_MAX_SIZE:
+            _verify_cache.popitem(last=False)
+    return True
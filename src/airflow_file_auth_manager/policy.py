@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -36,11 +37,12 @@ class Permission(str, Enum):
     MENU = "MENU"
 
 
-# Role hierarchy: admin > editor > viewer
-ROLE_HIERARCHY = {
-    Role.ADMIN: 3,
-    Role.EDITOR: 2,
-    Role.VIEWER: 1,
+# Role hierarchy: admin > editor > viewer. Keyed by plain str so lookups
+# skip Enum construction; Role members hash and compare equal to their values
+ROLE_HIERARCHY: dict[str, int] = {
+    Role.ADMIN.value: 3,
+    Role.EDITOR.value: 2,
+    Role.VIEWER.value: 1,
 }
 
 
@@ -71,15 +73,12 @@ class FileAuthPolicy:
     @classmethod
     def get_role_level(cls, role: str) -> int:
         """Get the hierarchy level for a role."""
-        try:
-            return ROLE_HIERARCHY[Role(role)]
-        except (ValueError, KeyError):
-            return 0
+        return ROLE_HIERARCHY.get(role, 0)
 
     @classmethod
     def has_minimum_role(cls, user_role: str, required_role: Role) -> bool:
         """Check if user has at least the required role level."""
-        return cls.get_role_level(user_role) >= ROLE_HIERARCHY[required_role]
+        return _has_minimum_role(user_role, required_role)
 
     @classmethod
     def is_authorized_configuration(
@@ -90,9 +89,7 @@ class FileAuthPolicy:
         details: ConfigurationDetails | None = None,
     ) -> bool:
         """Check if user can access configuration."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.ADMIN)
+        return _is_allowed("configuration", method, user_role)
 
     @classmethod
     def is_authorized_connection(
@@ -103,9 +100,7 @@ class FileAuthPolicy:
         details: ConnectionDetails | None = None,
     ) -> bool:
         """Check if user can access connections."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.ADMIN)
+        return _is_allowed("connection", method, user_role)
 
     @classmethod
     def is_authorized_dag(
@@ -117,9 +112,7 @@ class FileAuthPolicy:
         details: DagDetails | None = None,
     ) -> bool:
         """Check if user can access Dags."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.EDITOR)
+        return _is_allowed("dag", method, user_role)
 
     @classmethod
     def is_authorized_dataset(
@@ -130,9 +123,7 @@ class FileAuthPolicy:
         details: AssetDetails | None = None,
     ) -> bool:
         """Check if user can access datasets."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.EDITOR)
+        return _is_allowed("dataset", method, user_role)
 
     @classmethod
     def is_authorized_pool(
@@ -143,9 +134,7 @@ class FileAuthPolicy:
         details: PoolDetails | None = None,
     ) -> bool:
         """Check if user can access pools."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.ADMIN)
+        return _is_allowed("pool", method, user_role)
 
     @classmethod
     def is_authorized_variable(
@@ -156,9 +145,7 @@ class FileAuthPolicy:
         details: VariableDetails | None = None,
     ) -> bool:
         """Check if user can access variables."""
-        if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        return cls.has_minimum_role(user_role, Role.ADMIN)
+        return _is_allowed("variable", method, user_role)
 
     @classmethod
     def is_authorized_view(
@@ -181,7 +168,56 @@ class FileAuthPolicy:
     ) -> bool:
         """Check if user can access custom views/resources."""
         if method in cls.READ_ONLY_METHODS:
-            return cls.has_minimum_role(user_role, Role.VIEWER)
-        if resource_name in cls.ADMIN_ONLY_RESOURCES:
-            return cls.has_minimum_role(user_role, Role.ADMIN)
-        return cls.has_minimum_role(user_role, Role.EDITOR)
+            required_role = Role.VIEWER
+        elif resource_name in cls.ADMIN_ONLY_RESOURCES:
+            required_role = Role.ADMIN
+        else:
+            required_role = Role.EDITOR
+        return _has_minimum_role(user_role, required_role)
+
+
+@lru_cache(maxsize=16)
+def _has_minimum_role(user_role: str, required_role: str) -> bool:
+    """Compare role levels; the (role, required role) domain is tiny, so memoize.
+
+    Role members hash and compare equal to their values, so Role.ADMIN and
+    "admin" share a cache entry.
+    """
+    return ROLE_HIERARCHY.get(user_role, 0) >= ROLE_HIERARCHY[required_role]
+
+
+# Role required to modify each resource; reads only need viewer
+_WRITE_ROLES = {
+    "configuration": Role.ADMIN,
+    "connection": Role.ADMIN,
+    "dag": Role.EDITOR,
+    "dataset": Role.EDITOR,
+    "pool": Role.ADMIN,
+    "variable": Role.ADMIN,
+}
+
+
+def _build_policy_table() -> dict[tuple[str, str], int]:
+    """Precompute the minimum role level for every (resource, method)."""
+    return {
+        (resource, method.value): ROLE_HIERARCHY[
+            Role.VIEWER if method in FileAuthPolicy.READ_ONLY_METHODS else write_role
+        ]
+        for resource, write_role in _WRITE_ROLES.items()
+        for method in Permission
+    }
+
+
+_POLICY_TABLE = _build_policy_table()
+
+
+def _is_allowed(resource: str, method: str, user_role: str) -> bool:
+    """Compare the user's role level with the level required for the request.
+
+    Methods outside Permission are denied, matching FileAuthManager's
+    permission table.
+    """
+    required = _POLICY_TABLE.get((resource, method))
+    if required is None:
+        return False
+    return ROLE_HIERARCHY.get(user_role, 0) >= required
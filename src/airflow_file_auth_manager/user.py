@@ -4,8 +4,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+# Roles a user may be assigned
+VALID_ROLES = frozenset({"admin", "editor", "viewer"})
 
-@dataclass
+# One shared string per role, so loaded users do not each hold a copy
+_CANONICAL_ROLES = {role: role for role in VALID_ROLES}
+
+# Optional fields and their defaults, as read by FileUser.from_dict
+_OPTIONAL_FIELDS = {
+    "email": "",
+    "active": True,
+    "first_name": "",
+    "last_name": "",
+}
+
+
+@dataclass(slots=True)
 class FileUser:
     """Represents a user stored in the YAML file."""
 
@@ -24,8 +38,10 @@ class FileUser:
             raise ValueError("username is required")
         if not self.password_hash:
             raise ValueError("password_hash is required")
-        if self.role not in ("admin", "editor", "viewer"):
+        role = _CANONICAL_ROLES.get(self.role) if isinstance(self.role, str) else None
+        if role is None:
             raise ValueError(f"Invalid role: {self.role}. Must be admin, editor, or viewer")
+        self.role = role
 
     @property
     def is_active(self) -> bool:
@@ -68,13 +84,11 @@ class FileUser:
     @classmethod
     def from_dict(cls, data: dict) -> FileUser:
         """Create a FileUser from a dictionary."""
+        get = data.get
         return cls(
             username=data["username"],
             password_hash=data["password_hash"],
             role=data["role"],
-            email=data.get("email", ""),
-            active=data.get("active", True),
-            first_name=data.get("first_name", ""),
-            last_name=data.get("last_name", ""),
-            metadata=data.get("metadata", {}),
+            metadata=get("metadata", {}),
+            **{key: get(key, default) for key, default in _OPTIONAL_FIELDS.items()},
         )
@@ -1,46 +1,158 @@
-"""YAML-based user storage management."""
+"""YAML/JSON file-based user storage management."""
 
 from __future__ import annotations
 
 import fcntl
+import functools
+import hashlib
+import json
 import logging
 import os
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import yaml
 
-from airflow_file_auth_manager.password import hash_password, verify_password
-from airflow_file_auth_manager.user import FileUser
+# Prefer the libyaml C bindings, fall back to pure-Python when unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from airflow_file_auth_manager.password import (
+    hash_password,
+    needs_rehash,
+    validate_bcrypt_rounds,
+    validate_password,
+    verify_password,
+)
+from airflow_file_auth_manager.user import _CANONICAL_ROLES, VALID_ROLES, FileUser
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_USERS_FILE = "users.yaml"
 
+# Users files with this extension are stored as JSON instead of YAML
+JSON_SUFFIX = ".json"
+
+# Parsed users file is cached next to it as JSON, keyed by the file's
+# inode, mtime and size
+CACHE_SUFFIX = ".cache.json"
+
+# Writers in every process serialize on this file next to the users file; the
+# users file itself cannot hold the lock because save() replaces it
+LOCK_SUFFIX = ".lock"
+
 # Hot reload check interval in seconds
 HOT_RELOAD_CHECK_INTERVAL = 5.0
 
+# Safety-net check interval when filesystem events are watched (events can be
+# missed on network filesystems or for symlink swaps)
+WATCHED_RELOAD_CHECK_INTERVAL = 60.0
+
+# Users built from a file, shared by all UserStores in the process and keyed
+# by the file's identity and version so an unchanged file is never re-parsed
+PARSE_CACHE_MAX_SIZE = 4
+_parse_cache: OrderedDict[tuple[int, int, int, int], dict[str, FileUser]] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int, int]:
+    """Identify a file version by device, inode, mtime and size."""
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def clear_parse_cache() -> None:
+    """Drop all users cached from parsed files."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
+# Fields accepted by add_users(), mirroring the add_user() arguments
+_ADD_USER_REQUIRED = frozenset({"username", "password", "role"})
+_ADD_USER_FIELDS = _ADD_USER_REQUIRED | {"email", "first_name", "last_name", "active"}
+
+
+def _copy_users(users: dict[str, FileUser]) -> dict[str, FileUser]:
+    """Copy users so callers mutating them cannot corrupt the parse cache."""
+    # Metadata is not validated on load, so it may be null or a scalar
+    return {
+        name: replace(
+            user,
+            metadata=dict(user.metadata) if isinstance(user.metadata, dict) else user.metadata,
+        )
+        for name, user in users.items()
+    }
+
+
+def _json_dumps(obj: object, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> object:
+    """Deserialize JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class UserStore:
-    """Manages user storage in YAML file.
+    """Manages user storage in a YAML or JSON file.
+
+    Files ending in ``.json`` are read and written as JSON, which parses much
+    faster than YAML; any other extension uses YAML.
 
     Features:
     - Atomic file writes (tempfile + rename)
     - File locking for concurrent access safety
     - Hot reload support (auto-detects file changes)
+    - JSON sidecar cache of the parsed file to skip YAML parsing
     """
 
-    def __init__(self, users_file: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        users_file: str | Path | None = None,
+        *,
+        bcrypt_rounds: int | None = None,
+        rehash_on_login: bool = False,
+        watch: bool = False,
+    ) -> None:
         """Initialize UserStore.
 
         Args:
-            users_file: Path to YAML file. If None, uses AIRFLOW_FILE_AUTH_USERS_FILE
+            users_file: Path to YAML or JSON file. If None, uses AIRFLOW_FILE_AUTH_USERS_FILE
                        env var or defaults to 'users.yaml' in AIRFLOW_HOME.
+            bcrypt_rounds: bcrypt cost for new hashes. Defaults to BCRYPT_ROUNDS.
+            rehash_on_login: Upgrade and save hashes created with a lower cost
+                             than bcrypt_rounds after a successful login.
+            watch: Detect file changes through filesystem events (requires
+                   watchdog) instead of polling every few seconds.
+
+        Raises:
+            ValueError: If bcrypt_rounds is outside bcrypt's supported range.
         """
         if users_file:
             self._file_path = Path(users_file)
@@ -52,36 +164,198 @@ class UserStore:
                 airflow_home = os.environ.get("AIRFLOW_HOME", "~/airflow")
                 self._file_path = Path(airflow_home).expanduser() / DEFAULT_USERS_FILE
 
+        # Fail at startup rather than inside bcrypt on the first hash
+        self._bcrypt_rounds = None if bcrypt_rounds is None else validate_bcrypt_rounds(bcrypt_rounds)
+        self._rehash_on_login = rehash_on_login
         self._users: dict[str, FileUser] = {}
         self._loaded = False
-        self._last_mtime: float = 0.0
-        self._last_check_time: float = 0.0
+        # Set by mutations not yet written by save()
+        self._dirty = False
+        # Number of open batch() blocks
+        self._batch_depth = 0
+        # Serializes saves from threads sharing this store
+        self._write_lock = threading.Lock()
+        self._last_stat_key: tuple[int, int, int, int] | None = None
+        # Digest of the content last written by save(), to skip no-op saves
+        self._saved_digest: bytes | None = None
+        # Monotonic deadline (ns) of the next hot-reload stat
+        self._next_check_ns = 0
+
+        # Set by the watchdog observer thread when the users file changes
+        self._watch = watch
+        self._observer = None
+        self._changed = threading.Event()
 
     @property
     def file_path(self) -> Path:
         """Return the users file path."""
         return self._file_path
 
+    @property
+    def is_json(self) -> bool:
+        """Return True if the users file is stored as JSON."""
+        return self._file_path.suffix.lower() == JSON_SUFFIX
+
+    @property
+    def cache_path(self) -> Path:
+        """Return the path of the parsed-users JSON sidecar."""
+        return self._file_path.with_name(self._file_path.name + CACHE_SUFFIX)
+
+    def _read_cache(self, source_stat: os.stat_result) -> dict | None:
+        """Return cached parsed data if the sidecar matches the users file."""
+        try:
+            cached = _json_loads(self.cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable users cache %s: %s", self.cache_path, e)
+            return None
+
+        if (
+            not isinstance(cached, dict)
+            or cached.get("source_ino") != source_stat.st_ino
+            or cached.get("source_mtime_ns") != source_stat.st_mtime_ns
+            or cached.get("source_size") != source_stat.st_size
+        ):
+            return None
+
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _write_cache(self, source_stat: os.stat_result, data: dict) -> None:
+        """Write parsed data to the JSON sidecar. Failures are not fatal."""
+        payload = {
+            # The inode catches files swapped in with preserved mtime (cp -p,
+            # rsync -t, Kubernetes ConfigMap symlink updates)
+            "source_ino": source_stat.st_ino,
+            "source_mtime_ns": source_stat.st_mtime_ns,
+            "source_size": source_stat.st_size,
+            "data": data,
+        }
+        temp_path = None
+        try:
+            content = _json_dumps(payload)
+            # Skip data that would not survive a JSON round trip (e.g. YAML dates)
+            if _json_loads(content)["data"] != data:
+                return
+
+            fd, temp_path = tempfile.mkstemp(
+                suffix=".tmp",
+                prefix=".users_cache_",
+                dir=self._file_path.parent,
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, self.cache_path)
+            temp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write users cache %s: %s", self.cache_path, e)
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _remove_cache(self) -> None:
+        """Delete the JSON sidecar if present."""
+        try:
+            self.cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Failed to remove users cache %s: %s", self.cache_path, e)
+
+    def _parse(self, content: bytes) -> dict:
+        """Parse users file content according to the file format."""
+        if self.is_json:
+            return _json_loads(content) if content.strip() else {}
+        return yaml.load(content, Loader=SafeLoader) or {}
+
+    def _serialize(self, data: dict) -> bytes:
+        """Serialize users file content according to the file format."""
+        if self.is_json:
+            return _json_dumps(data, indent=True) + b"\n"
+        return yaml.dump(
+            data,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            encoding="utf-8",
+        )
+
+    def _start_watcher(self) -> None:
+        """Watch the users file for changes via watchdog, if installed."""
+        watched = os.path.abspath(self._file_path)
+        if os.path.realpath(watched) != watched:
+            # Symlink swaps, e.g. Kubernetes ConfigMap updates of ..data, emit
+            # no event naming this path, so keep the regular stat polling
+            logger.info("Users file is behind a symlink, polling it for changes: %s", watched)
+            self._watch = False
+            return
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed, polling users file for changes")
+            self._watch = False
+            return
+
+        changed = self._changed
+
+        class _UsersFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if watched in (event.src_path, getattr(event, "dest_path", "")):
+                    changed.set()
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_UsersFileHandler(), os.path.dirname(watched), recursive=False)
+        try:
+            observer.start()
+        except OSError as e:
+            logger.warning("Failed to watch users file, falling back to polling: %s", e)
+            self._watch = False
+            return
+        self._observer = observer
+        logger.debug("Watching users file for changes: %s", watched)
+
+    def close(self) -> None:
+        """Stop watching the users file."""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
     def _check_hot_reload(self) -> None:
         """Check if file has changed and reload if necessary."""
-        current_time = time.time()
-
-        # Only check periodically to avoid excessive stat calls
-        if current_time - self._last_check_time < HOT_RELOAD_CHECK_INTERVAL:
+        if self._dirty or self._batch_depth:
+            # Reloading now would discard changes not yet written by save()
             return
 
-        self._last_check_time = current_time
+        now = time.monotonic_ns()
 
-        if not self._file_path.exists():
+        if self._changed.is_set():
+            self._changed.clear()
+        elif now < self._next_check_ns:
+            # Only check periodically to avoid excessive stat calls
             return
 
+        interval = (
+            WATCHED_RELOAD_CHECK_INTERVAL
+            if self._observer is not None
+            else HOT_RELOAD_CHECK_INTERVAL
+        )
+        self._next_check_ns = now + int(interval * 1_000_000_000)
+
+        # A single stat both detects a missing file and reads its version
         try:
-            current_mtime = self._file_path.stat().st_mtime
-            if current_mtime > self._last_mtime:
-                logger.info("Users file changed, reloading: %s", self._file_path)
-                self.reload()
+            current_key = _stat_key(self._file_path.stat())
+        except FileNotFoundError:
+            return
         except OSError as e:
             logger.debug("Failed to stat users file: %s", e)
+            return
+
+        if current_key != self._last_stat_key:
+            logger.info("Users file changed, reloading: %s", self._file_path)
+            self.reload()
 
     def _ensure_loaded(self) -> None:
         """Ensure users are loaded from file."""
@@ -92,57 +366,142 @@ class UserStore:
             self._check_hot_reload()
 
     def load(self) -> None:
-        """Load users from YAML file with file locking."""
-        self._users = {}
+        """Load users from the users file.
+
+        The new users are built aside and swapped in with a single assignment,
+        so concurrent readers see either the old or the new users, never an
+        empty or partial mapping.
+        """
+        self._dirty = False
+        self._saved_digest = None
 
         if not self._file_path.exists():
             logger.warning("Users file not found: %s", self._file_path)
+            self._users = {}
             self._loaded = True
             return
 
         try:
-            with open(self._file_path, encoding="utf-8") as f:
-                # Acquire shared lock for reading
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    data = yaml.safe_load(f) or {}
-                    # Record file modification time for hot reload
-                    self._last_mtime = self._file_path.stat().st_mtime
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-            version = data.get("version", "1.0")
-            if version != "1.0":
-                logger.warning("Unknown users file version: %s", version)
+            source_stat = self._file_path.stat()
+            cache_key = _stat_key(source_stat)
+            with _parse_cache_lock:
+                cached = _parse_cache.get(cache_key)
+                if cached is not None:
+                    _parse_cache.move_to_end(cache_key)
+
+            if cached is None:
+                source_stat, users = self._read_users(source_stat)
+                cache_key = _stat_key(source_stat)
+                with _parse_cache_lock:
+                    _parse_cache[cache_key] = _copy_users(users)
+                    while len(_parse_cache) > PARSE_CACHE_MAX_SIZE:
+                        _parse_cache.popitem(last=False)
+            else:
+                users = _copy_users(cached)
 
-            users_data = data.get("users", [])
-            for user_data in users_data:
-                try:
-                    user = FileUser.from_dict(user_data)
-                    self._users[user.username] = user
-                except (KeyError, ValueError) as e:
-                    logger.error("Invalid user entry: %s - %s", user_data, e)
+            self._users = users
+            # Record file version for hot reload
+            self._last_stat_key = cache_key
+            if self._watch and self._observer is None:
+                self._start_watcher()
 
             logger.info("Loaded %d users from %s", len(self._users), self._file_path)
             self._loaded = True
 
-        except yaml.YAMLError as e:
+        except (yaml.YAMLError, ValueError) as e:
             logger.error("Failed to parse users file: %s", e)
+            self._users = {}
             self._loaded = True
         except OSError as e:
             logger.error("Failed to read users file: %s", e)
+            self._users = {}
             self._loaded = True
 
+    def _read_users(self, source_stat: os.stat_result) -> tuple[os.stat_result, dict[str, FileUser]]:
+        """Read and build users from the sidecar or the users file itself.
+
+        Returns:
+            The stat of the version that was read, and the users by name.
+        """
+        # JSON parses as fast as the sidecar itself, so only YAML uses it
+        data = None if self.is_json else self._read_cache(source_stat)
+        if data is None:
+            # No read lock: writers must replace the file atomically (save()
+            # writes a temp file and renames it), so a reader always sees one
+            # complete version. A torn in-place edit fails to parse and is
+            # reloaded once its stat changes.
+            with open(self._file_path, "rb") as f:
+                source_stat = os.fstat(f.fileno())
+                content = f.read()
+            data = self._parse(content)
+            if not self.is_json:
+                self._write_cache(source_stat, data)
+
+        version = data.get("version", "1.0")
+        if version != "1.0":
+            logger.warning("Unknown users file version: %s", version)
+
+        users_data = data.get("users", [])
+        from_dict = FileUser.from_dict
+        try:
+            # Fast path: every entry is valid
+            users = {user.username: user for user in map(from_dict, users_data)}
+        except (KeyError, ValueError):
+            # Slow path: rebuild entry by entry, skipping and logging bad ones
+            users = {}
+            for user_data in users_data:
+                try:
+                    user = from_dict(user_data)
+                    users[user.username] = user
+                except (KeyError, ValueError) as e:
+                    logger.error("Invalid user entry: %s - %s", user_data, e)
+        return source_stat, users
+
     def reload(self) -> None:
         """Reload users from file."""
         self._loaded = False
         self.load()
 
+    @contextmanager
+    def _write_locked(self) -> Iterator[None]:
+        """Hold this store's write lock and an exclusive lock on the lock file."""
+        with self._write_lock:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = self._file_path.with_name(self._file_path.name + LOCK_SUFFIX)
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                # Closing the descriptor releases the flock
+                os.close(fd)
+
+    def _unchanged_on_disk(self) -> bool:
+        """Return True if the users file is still the version last loaded or saved."""
+        try:
+            return _stat_key(self._file_path.stat()) == self._last_stat_key
+        except FileNotFoundError:
+            return False
+
     def save(self) -> None:
-        """Save users to YAML file atomically with file locking.
+        """Save users to the users file atomically with file locking.
 
         Uses tempfile + rename pattern for atomic writes to prevent
-        file corruption on crash.
+        file corruption on crash. Nothing is written if the file still holds
+        the content of the previous save.
+        """
+        with self._write_locked():
+            self._save_locked()
+
+    def _save_locked(self, *, if_unchanged: bool = False) -> bool:
+        """Write the users file; the caller must hold _write_locked().
+
+        Args:
+            if_unchanged: Give up instead of replacing the file if it was
+                          changed on disk since it was last loaded or saved.
+
+        Returns:
+            False if the write was given up because of if_unchanged.
         """
         data = {
             "version": "1.0",
@@ -152,6 +511,22 @@ class UserStore:
         # Ensure parent directory exists
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        content = self._serialize(data)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+
+        # Keep the original file's permissions, or a secure owner-only default
+        try:
+            current_stat = self._file_path.stat()
+        except FileNotFoundError:
+            mode = 0o600
+        else:
+            # Nothing to write if the file still holds exactly what we last saved
+            if digest == self._saved_digest and _stat_key(current_stat) == self._last_stat_key:
+                self._dirty = False
+                logger.debug("Users file unchanged, skipping save: %s", self._file_path)
+                return True
+            mode = current_stat.st_mode
+
         # Write to temporary file first, then atomically rename
         fd = None
         temp_path = None
@@ -163,33 +538,35 @@ class UserStore:
                 dir=self._file_path.parent,
             )
 
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
+            with os.fdopen(fd, "wb") as f:
                 fd = None  # os.fdopen takes ownership
-                # Acquire exclusive lock for writing
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-            # Set same permissions as original file or secure default
-            if self._file_path.exists():
-                original_mode = self._file_path.stat().st_mode
-                os.chmod(temp_path, original_mode)
-            else:
-                # Secure default: readable only by owner
-                os.chmod(temp_path, 0o600)
+                os.fchmod(f.fileno(), mode)
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+                # The rename keeps the inode, so this is the saved version
+                saved_stat = os.fstat(f.fileno())
+
+            if if_unchanged and not self._unchanged_on_disk():
+                os.unlink(temp_path)
+                return False
 
             # Atomic rename
             os.replace(temp_path, self._file_path)
             temp_path = None  # Successfully renamed
 
-            # Update mtime tracking
-            self._last_mtime = self._file_path.stat().st_mtime
+            # Update file version tracking
+            self._last_stat_key = _stat_key(saved_stat)
+            self._saved_digest = digest
+            self._dirty = False
+
+            # Refresh the sidecar so the next load in any process skips YAML
+            if not self.is_json:
+                self._remove_cache()
+                self._write_cache(saved_stat, data)
 
             logger.info("Saved %d users to %s", len(self._users), self._file_path)
+            return True
 
         except Exception:
             # Clean up temp file on error
@@ -199,6 +576,57 @@ class UserStore:
                 os.unlink(temp_path)
             raise
 
+    @property
+    def dirty(self) -> bool:
+        """Return True if there are changes not yet saved."""
+        return self._dirty
+
+    @contextmanager
+    def batch(self) -> Iterator[UserStore]:
+        """Group mutations so they are written with a single save on exit.
+
+        Nothing is written if the block makes no changes. If the block
+        raises, its changes are rolled back in memory and nothing is written.
+        Hot reload is paused while the block is open, so external edits made
+        meanwhile do not discard its changes.
+
+        Example:
+            with store.batch():
+                store.add_user("alice", password, "viewer")
+                store.add_user("bob", password, "editor")
+        """
+        self._ensure_loaded()
+        snapshot = _copy_users(self._users)
+        dirty = self._dirty
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            # Drop the failed block's changes so a later save() cannot write them
+            self._users = snapshot
+            self._dirty = dirty
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._dirty:
+            self.save()
+
+    def export(self, users_file: str | Path) -> UserStore:
+        """Write all users to another file, in the format of its extension.
+
+        Args:
+            users_file: Destination path (``.json`` for JSON, otherwise YAML).
+
+        Returns:
+            UserStore for the destination file.
+        """
+        self._ensure_loaded()
+        target = UserStore(users_file)
+        target._users = dict(self._users)
+        target._loaded = True
+        target.save()
+        return target
+
     def get_user(self, username: str) -> FileUser | None:
         """Get user by username."""
         self._ensure_loaded()
@@ -234,9 +662,38 @@ class UserStore:
             logger.warning("Authentication failed - invalid password: %s", username)
             return None
 
+        if self._rehash_on_login and needs_rehash(user.password_hash, self._bcrypt_rounds):
+            self._rehash(user, password)
+
         logger.info("User authenticated successfully: %s", username)
         return user
 
+    def _rehash(self, user: FileUser, password: str) -> None:
+        """Regenerate a user's hash at the configured cost and save it.
+
+        The file is only replaced if nothing else changed it since it was
+        loaded, so external edits made during the slow hash are kept.
+        """
+        try:
+            if not self._unchanged_on_disk():
+                # Edited on disk since load; retry after the next reload
+                return
+            password_hash = hash_password(
+                password, validate=False, rounds=self._bcrypt_rounds
+            )
+            with self._write_locked():
+                old_hash = user.password_hash
+                user.password_hash = password_hash
+                if not self._save_locked(if_unchanged=True):
+                    user.password_hash = old_hash
+                    logger.info(
+                        "Users file changed during rehash, keeping it: %s", self._file_path
+                    )
+                    return
+            logger.info("Upgraded password hash cost for user: %s", user.username)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to upgrade password hash for %s: %s", user.username, e)
+
     def add_user(
         self,
         username: str,
@@ -269,7 +726,7 @@ class UserStore:
         if username in self._users:
             raise ValueError(f"User already exists: {username}")
 
-        password_hash = hash_password(password)
+        password_hash = hash_password(password, rounds=self._bcrypt_rounds)
         user = FileUser(
             username=username,
             password_hash=password_hash,
@@ -281,9 +738,74 @@ class UserStore:
         )
 
         self._users[username] = user
+        self._dirty = True
         logger.warning("AUDIT: User created: %s (role: %s)", username, role)
         return user
 
+    def add_users(self, users: Iterable[dict]) -> list[FileUser]:
+        """Add several users, hashing their passwords in parallel.
+
+        Args:
+            users: Dictionaries of add_user() arguments, one per user.
+
+        Returns:
+            Created FileUsers, in input order.
+
+        Raises:
+            ValueError: If an entry is malformed, has an invalid role or a
+                password that fails the policy, or its username already exists
+                or is repeated. No user is added if any entry is invalid.
+        """
+        self._ensure_loaded()
+        entries = list(users)
+        if not entries:
+            return []
+
+        # Validate everything before spending time on bcrypt
+        seen: set[str] = set()
+        for entry in entries:
+            if not isinstance(entry, dict):
+                raise ValueError(f"Invalid user entry: {entry!r}")
+            missing = _ADD_USER_REQUIRED - entry.keys()
+            if missing:
+                raise ValueError(f"Missing fields for user entry: {', '.join(sorted(missing))}")
+            unknown = entry.keys() - _ADD_USER_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown fields for user entry: {', '.join(sorted(unknown))}")
+            username = entry["username"]
+            if not isinstance(username, str) or not username:
+                raise ValueError(f"Invalid username: {username!r}")
+            if username in self._users or username in seen:
+                raise ValueError(f"User already exists: {username}")
+            if not isinstance(entry["role"], str) or entry["role"] not in VALID_ROLES:
+                raise ValueError(f"Invalid role: {entry['role']}. Must be admin, editor, or viewer")
+            if not isinstance(entry["password"], str):
+                raise ValueError(f"Invalid password for user entry: {username}")
+            validate_password(entry["password"])
+            seen.add(username)
+
+        # Passwords were validated above; bcrypt releases the GIL, so
+        # threads hash on all cores
+        hash_with_rounds = functools.partial(
+            hash_password, validate=False, rounds=self._bcrypt_rounds
+        )
+        workers = min(len(entries), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-auth-hash") as executor:
+            hashes = list(executor.map(hash_with_rounds, [entry["password"] for entry in entries]))
+
+        created = [
+            FileUser(
+                password_hash=password_hash,
+                **{key: value for key, value in entry.items() if key != "password"},
+            )
+            for entry, password_hash in zip(entries, hashes, strict=True)
+        ]
+        for user in created:
+            self._users[user.username] = user
+            logger.warning("AUDIT: User created: %s (role: %s)", user.username, user.role)
+        self._dirty = True
+        return created
+
     def update_user(
         self,
         username: str,
@@ -321,13 +843,14 @@ class UserStore:
         changes = []
 
         if password is not None:
-            user.password_hash = hash_password(password)
+            user.password_hash = hash_password(password, rounds=self._bcrypt_rounds)
             changes.append("password")
         if role is not None:
-            if role not in ("admin", "editor", "viewer"):
+            canonical = _CANONICAL_ROLES.get(role) if isinstance(role, str) else None
+            if canonical is None:
                 raise ValueError(f"Invalid role: {role}")
             old_role = user.role
-            user.role = role
+            user.role = canonical
             changes.append(f"role: {old_role} -> {role}")
         if email is not None:
             user.email = email
@@ -343,6 +866,7 @@ class UserStore:
             user.active = active
             changes.append(f"active: {old_active} -> {active}")
 
+        self._dirty = True
         logger.warning("AUDIT: User updated: %s (changes: %s)", username, ", ".join(changes))
         return user
 
@@ -361,6 +885,7 @@ class UserStore:
             raise ValueError(f"User not found: {username}")
 
         del self._users[username]
+        self._dirty = True
         logger.warning("AUDIT: User deleted: %s", username)
 
     def user_exists(self, username: str) -> bool:
@@ -9,9 +9,15 @@ from typing import TYPE_CHECKING
 import pytest
 import yaml
 
-from airflow_file_auth_manager.password import hash_password
+from airflow_file_auth_manager import password as password_module
+from airflow_file_auth_manager import user_store as user_store_module
+from airflow_file_auth_manager.password import (
+    clear_verify_cache,
+    hash_password,
+    validate_password,
+)
 from airflow_file_auth_manager.user import FileUser
-from airflow_file_auth_manager.user_store import UserStore
+from airflow_file_auth_manager.user_store import UserStore, clear_parse_cache
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -24,6 +30,50 @@ TEST_PASSWORD_EDITOR = "Editor@123"
 TEST_PASSWORD_VIEWER = "Viewer@123"
 TEST_PASSWORD_INACTIVE = "Inactive@123"
 
+# Minimum bcrypt cost; tests do not need production strength
+TEST_BCRYPT_ROUNDS = 4
+
+# bcrypt hashes shared by all tests, keyed by (password, rounds)
+_HASH_CACHE: dict[tuple[str, int | None], str] = {}
+
+
+def cached_hash_password(password: str, validate: bool = True, rounds: int | None = None) -> str:
+    """Return a memoized bcrypt hash so tests do not repeat the key schedule.
+
+    Validation still runs on every call, and verify_password is left
+    untouched, so cached hashes are checked by the real verifier.
+    """
+    if validate:
+        validate_password(password)
+    key = (password, rounds)
+    password_hash = _HASH_CACHE.get(key)
+    if password_hash is None:
+        password_hash = _HASH_CACHE[key] = hash_password(password, validate=False, rounds=rounds)
+    return password_hash
+
+
+@pytest.fixture(autouse=True)
+def _fast_bcrypt_rounds(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hash with the minimum bcrypt cost unless a test asks for another."""
+    monkeypatch.setattr(password_module, "BCRYPT_ROUNDS", TEST_BCRYPT_ROUNDS)
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches() -> None:
+    """Start every test with empty verify and parse caches.
+
+    Memoized hashes are identical across tests, so a verification cached by
+    one test would otherwise turn into a cache hit in the next.
+    """
+    clear_verify_cache()
+    clear_parse_cache()
+
+
+@pytest.fixture(autouse=True)
+def _memoize_user_store_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve UserStore hashing from the session-wide hash cache."""
+    monkeypatch.setattr(user_store_module, "hash_password", cached_hash_password)
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -40,28 +90,28 @@ def sample_users_data() -> dict:
         "users": [
             {
                 "username": "admin",
-                "password_hash": hash_password(TEST_PASSWORD_ADMIN),
+                "password_hash": cached_hash_password(TEST_PASSWORD_ADMIN),
                 "role": "admin",
                 "email": "admin@example.com",
                 "active": True,
             },
             {
                 "username": "editor",
-                "password_hash": hash_password(TEST_PASSWORD_EDITOR),
+                "password_hash": cached_hash_password(TEST_PASSWORD_EDITOR),
                 "role": "editor",
                 "email": "editor@example.com",
                 "active": True,
             },
             {
                 "username": "viewer",
-                "password_hash": hash_password(TEST_PASSWORD_VIEWER),
+                "password_hash": cached_hash_password(TEST_PASSWORD_VIEWER),
                 "role": "viewer",
                 "email": "viewer@example.com",
                 "active": True,
             },
             {
                 "username": "inactive",
-                "password_hash": hash_password(TEST_PASSWORD_INACTIVE),
+                "password_hash": cached_hash_password(TEST_PASSWORD_INACTIVE),
                 "role": "viewer",
                 "email": "inactive@example.com",
                 "active": False,
@@ -90,7 +140,7 @@ def admin_user() -> FileUser:
     """Create an admin user."""
     return FileUser(
         username="admin",
-        password_hash=hash_password(TEST_PASSWORD_ADMIN),
+        password_hash=cached_hash_password(TEST_PASSWORD_ADMIN),
         role="admin",
         email="admin@example.com",
     )
@@ -101,7 +151,7 @@ def editor_user() -> FileUser:
     """Create an editor user."""
     return FileUser(
         username="editor",
-        password_hash=hash_password(TEST_PASSWORD_EDITOR),
+        password_hash=cached_hash_password(TEST_PASSWORD_EDITOR),
         role="editor",
         email="editor@example.com",
     )
@@ -112,7 +162,7 @@ def viewer_user() -> FileUser:
     """Create a viewer user."""
     return FileUser(
         username="viewer",
-        password_hash=hash_password(TEST_PASSWORD_VIEWER),
+        password_hash=cached_hash_password(TEST_PASSWORD_VIEWER),
         role="viewer",
         email="viewer@example.com",
     )
@@ -0,0 +1,56 @@
+"""Tests for the file-auth CLI."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from airflow_file_auth_manager.cli import main
+
+
+class TestRounds:
+    """Tests for the --rounds option."""
+
+    def test_out_of_range_rounds_rejected(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """An unsupported cost should be a usage error before any hashing."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["hash-password", "--rounds", "3", "--password", "Test@123"])
+
+        assert exc_info.value.code == 2
+        assert "between 4 and 31" in capsys.readouterr().err
+
+
+class TestMigrate:
+    """Tests for the migrate command."""
+
+    def test_migrate_to_json(self, users_file: Path) -> None:
+        """Should write every user to the JSON file."""
+        output = users_file.with_suffix(".json")
+        main(["migrate", "-f", str(users_file)])
+
+        data = json.loads(output.read_text())
+        assert len(data["users"]) == 4
+
+    def test_migrate_invalid_yaml_fails(self, temp_dir: Path) -> None:
+        """An unparseable source should exit non-zero without writing."""
+        source = temp_dir / "users.yaml"
+        source.write_text("version: '1.0'\nusers:\n  - username: admin\n   role: admin\n")
+        output = temp_dir / "users.json"
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["migrate", "-f", str(source)])
+
+        assert exc_info.value.code == 1
+        assert not output.exists()
+
+    def test_migrate_without_users_fails(self, temp_dir: Path) -> None:
+        """A source without any valid user should not be migrated."""
+        source = temp_dir / "users.yaml"
+        source.write_text("version: '1.0'\nusers: []\n")
+
+        with pytest.raises(SystemExit):
+            main(["migrate", "-f", str(source)])
+
+        assert not (temp_dir / "users.json").exists()
@@ -2,30 +2,63 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 # Skip entire module if Airflow 3.x auth module is not available
 pytest.importorskip("airflow.api_fastapi.auth.managers.base_auth_manager")
 
+from airflow_file_auth_manager.endpoints import MAX_FORM_BODY_SIZE, MAX_FORM_FIELDS
 from airflow_file_auth_manager.file_auth_manager import FileAuthManager
+from airflow_file_auth_manager.policy import FileAuthPolicy, Permission
 from airflow_file_auth_manager.user import FileUser
 
+from .conftest import TEST_PASSWORD_ADMIN
+
 if TYPE_CHECKING:
-    pass
+    from fastapi.testclient import TestClient
+
+
+class MockMenuItem:
+    """Menu item with a name attribute, simulating the MenuItem enum."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _ConfStub:
+    """Stand-in for Airflow's conf that returns the given options or fallbacks."""
+
+    def __init__(self, **options: object) -> None:
+        self._options = options
+
+    def get(self, section: str, key: str, fallback: object = None) -> object:
+        return self._options.get(key, fallback)
+
+    getint = getboolean = get
 
 
 @pytest.fixture
-def auth_manager(users_file: Path) -> FileAuthManager:
+def auth_manager(users_file: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[FileAuthManager]:
     """Create a FileAuthManager with test users."""
-    with patch("airflow_file_auth_manager.file_auth_manager.conf") as mock_conf:
-        mock_conf.get.return_value = str(users_file)
-        manager = FileAuthManager()
-        manager.init()
-        return manager
+    monkeypatch.setattr(
+        "airflow_file_auth_manager.file_auth_manager.conf", _ConfStub(users_file=str(users_file))
+    )
+    manager = FileAuthManager()
+    manager.init()
+    yield manager
+    manager.user_store.close()
+
+
+@pytest.fixture
+def auth_client(auth_manager: FileAuthManager) -> TestClient:
+    """Create a test client for the auth manager's endpoints."""
+    testclient = pytest.importorskip("fastapi.testclient")
+    return testclient.TestClient(auth_manager.get_fastapi_app())
 
 
 class TestFileAuthManagerInit:
@@ -52,6 +85,11 @@ class TestFileAuthManagerUrls:
         assert "next=" in url
         assert "%2Fdags" in url or "/dags" in url
 
+    def test_get_url_login_quotes_next(self, auth_manager: FileAuthManager) -> None:
+        """Query characters in next should be percent-encoded."""
+        url = auth_manager.get_url_login(next_url="/dags?a=b&c=d")
+        assert url == "/auth/login?next=%2Fdags%3Fa%3Db%26c%3Dd"
+
     def test_get_url_logout(self, auth_manager: FileAuthManager) -> None:
         """Should return logout URL."""
         url = auth_manager.get_url_logout()
@@ -92,6 +130,30 @@ class TestFileAuthManagerSerialization:
 class TestFileAuthManagerAuthorization:
     """Tests for authorization methods."""
 
+    def test_agrees_with_policy(
+        self,
+        auth_manager: FileAuthManager,
+        admin_user: FileUser,
+        editor_user: FileUser,
+        viewer_user: FileUser,
+    ) -> None:
+        """Manager and FileAuthPolicy should decide every request alike."""
+        checks = {
+            auth_manager.is_authorized_configuration: FileAuthPolicy.is_authorized_configuration,
+            auth_manager.is_authorized_connection: FileAuthPolicy.is_authorized_connection,
+            auth_manager.is_authorized_dag: FileAuthPolicy.is_authorized_dag,
+            auth_manager.is_authorized_asset: FileAuthPolicy.is_authorized_dataset,
+            auth_manager.is_authorized_pool: FileAuthPolicy.is_authorized_pool,
+            auth_manager.is_authorized_variable: FileAuthPolicy.is_authorized_variable,
+        }
+        methods = [*(permission.value for permission in Permission), "PATCH", "UNKNOWN"]
+        for manager_check, policy_check in checks.items():
+            for user in (admin_user, editor_user, viewer_user):
+                for method in methods:
+                    assert manager_check(method=method, user=user) == policy_check(
+                        method=method, user_role=user.role
+                    ), (manager_check.__name__, user.role, method)
+
     def test_is_authorized_configuration_admin(self, auth_manager: FileAuthManager, admin_user: FileUser) -> None:
         """Admin should be authorized for configuration."""
         assert auth_manager.is_authorized_configuration(method="PUT", user=admin_user)
@@ -127,6 +189,28 @@ class TestFileAuthManagerAuthorization:
         """Admin should be authorized for pools."""
         assert auth_manager.is_authorized_pool(method="POST", user=admin_user)
 
+    def test_missing_user_treated_as_viewer(self, auth_manager: FileAuthManager) -> None:
+        """A missing user should fall back to the most restrictive role."""
+        assert auth_manager.is_authorized_dag(method="GET", user=None)  # type: ignore[arg-type]
+        assert not auth_manager.is_authorized_dag(method="POST", user=None)  # type: ignore[arg-type]
+
+    def test_is_authorized_unknown_method_denied(self, auth_manager: FileAuthManager, admin_user: FileUser) -> None:
+        """Methods outside the policy should be denied, even for admins."""
+        assert not auth_manager.is_authorized_dag(method="PATCH", user=admin_user)  # type: ignore[arg-type]
+
+    def test_is_authorized_does_not_touch_user_store(
+        self, auth_manager: FileAuthManager, editor_user: FileUser
+    ) -> None:
+        """Role checks should read the user object only, never the store."""
+        with patch.object(
+            type(auth_manager.user_store), "get_user", side_effect=AssertionError("store lookup")
+        ):
+            for _ in range(50):
+                assert auth_manager.is_authorized_dag(method="PUT", user=editor_user)
+            assert auth_manager.batch_is_authorized_dag(
+                [{"method": "GET", "user": editor_user}] * 50
+            )
+
 
 class TestFileAuthManagerBatchAuthorization:
     """Tests for batch authorization methods."""
@@ -147,29 +231,91 @@ class TestFileAuthManagerBatchAuthorization:
         ]
         assert not auth_manager.batch_is_authorized_dag(requests)
 
+    def test_batch_is_authorized_connection_editor(self, auth_manager: FileAuthManager, editor_user: FileUser) -> None:
+        """Editor batch should pass for reads and fail once a write is included."""
+        reads = [{"method": "GET", "user": editor_user}] * 3
+        assert auth_manager.batch_is_authorized_connection(reads)
+        assert not auth_manager.batch_is_authorized_connection(
+            [*reads, {"method": "DELETE", "user": editor_user}]
+        )
+
+    def test_batch_is_authorized_with_user_kwarg(
+        self, auth_manager: FileAuthManager, editor_user: FileUser, viewer_user: FileUser
+    ) -> None:
+        """Airflow's (requests, *, user) signature should be honoured."""
+        requests = [{"method": "GET"}, {"method": "PUT"}]
+        assert auth_manager.batch_is_authorized_dag(requests, user=editor_user)
+        assert not auth_manager.batch_is_authorized_dag(requests, user=viewer_user)
+        assert not auth_manager.batch_is_authorized_variable(requests, user=editor_user)
+        assert not auth_manager.batch_is_authorized_dag([{"method": "PATCH"}], user=editor_user)
+
 
 class TestFileAuthManagerMenuFiltering:
     """Tests for menu filtering."""
 
     def test_filter_menu_items_admin(self, auth_manager: FileAuthManager, admin_user: FileUser) -> None:
         """Admin should see all menu items."""
-        # Create mock MenuItem objects with name attribute (simulating enum)
-        class MockMenuItem:
-            def __init__(self, name: str):
-                self.name = name
-
         items = [MockMenuItem("Dags"), MockMenuItem("Connections"), MockMenuItem("Variables")]
         filtered = auth_manager.filter_authorized_menu_items(items, user=admin_user)
         assert len(filtered) == 3
 
     def test_filter_menu_items_viewer(self, auth_manager: FileAuthManager, viewer_user: FileUser) -> None:
         """Viewer should not see admin-only menus."""
-        class MockMenuItem:
-            def __init__(self, name: str):
-                self.name = name
-
         items = [MockMenuItem("Dags"), MockMenuItem("Connections"), MockMenuItem("Variables")]
         filtered = auth_manager.filter_authorized_menu_items(items, user=viewer_user)
         # Viewer should only see Dags (Connections and Variables are admin-only)
         assert len(filtered) == 1
         assert filtered[0].name == "Dags"
+
+    def test_filter_menu_items_enum(self, auth_manager: FileAuthManager, editor_user: FileUser) -> None:
+        """Real MenuItem members should be filtered the same way."""
+        from airflow.api_fastapi.auth.managers.base_auth_manager import MenuItem
+
+        filtered = auth_manager.filter_authorized_menu_items(list(MenuItem), user=editor_user)
+        assert MenuItem.DAGS in filtered
+        assert MenuItem.CONNECTIONS not in filtered
+        assert MenuItem.CONFIG not in filtered
+        assert len(filtered) == len(MenuItem) - 4
+
+
+class TestFileAuthManagerTokenEndpoint:
+    """Tests for the /token login endpoint."""
+
+    FORM = {"content-type": "application/x-www-form-urlencoded"}
+
+    def test_form_login_redirects(
+        self,
+        auth_client: TestClient,
+        auth_manager: FileAuthManager,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A valid form login should set the cookie and redirect to next."""
+        monkeypatch.setattr(auth_manager, "generate_jwt", lambda user, **kwargs: "token")
+        response = auth_client.post(
+            "/token",
+            content=f"username=admin&password={TEST_PASSWORD_ADMIN}&next=/dags".encode(),
+            headers=self.FORM,
+            follow_redirects=False,
+        )
+        assert response.status_code == 303
+        assert response.headers["location"] == "/dags"
+        assert "_token=token" in response.headers["set-cookie"]
+
+    def test_oversized_form_rejected(self, auth_client: TestClient) -> None:
+        """A form body over the size limit should be refused with 413."""
+        body = b"username=admin&password=" + b"x" * MAX_FORM_BODY_SIZE
+        response = auth_client.post("/token", content=body, headers=self.FORM)
+        assert response.status_code == 413
+
+    def test_duplicate_form_field_rejected(self, auth_client: TestClient) -> None:
+        """A repeated username should not silently resolve to one of its values."""
+        body = f"username=viewer&username=admin&password={TEST_PASSWORD_ADMIN}".encode()
+        response = auth_client.post("/token", content=body, headers=self.FORM)
+        assert response.status_code == 400
+        assert "set-cookie" not in response.headers
+
+    def test_too_many_form_fields_rejected(self, auth_client: TestClient) -> None:
+        """A form with more fields than a login form needs should be refused."""
+        body = "&".join(f"f{i}=x" for i in range(MAX_FORM_FIELDS + 1)).encode()
+        response = auth_client.post("/token", content=body, headers=self.FORM)
+        assert response.status_code == 400
@@ -6,7 +6,11 @@ import pytest
 
 from airflow_file_auth_manager.password import (
     PasswordPolicyError,
+    clear_verify_cache,
+    get_hash_rounds,
     hash_password,
+    needs_rehash,
+    validate_bcrypt_rounds,
     validate_password,
     verify_password,
 )
@@ -47,6 +51,11 @@ class TestPasswordPolicy:
         with pytest.raises(PasswordPolicyError, match="digit"):
             validate_password("Test@abc")
 
+    def test_non_ascii_digit_counts_as_digit(self) -> None:
+        """Unicode decimal digits should satisfy the digit rule, like \\d."""
+        validate_password("Test@abc\u0663")  # ARABIC-INDIC DIGIT THREE
+        validate_password("Test@abc\uff15")  # FULLWIDTH DIGIT FIVE
+
     def test_password_missing_special(self) -> None:
         """Password without special character should fail."""
         with pytest.raises(PasswordPolicyError, match="special character"):
@@ -91,6 +100,20 @@ class TestHashPassword:
         hashed = hash_password("weak", validate=False)
         assert hashed.startswith("$2b$")
 
+    def test_hash_password_custom_rounds(self) -> None:
+        """hash_password should honor an explicit cost factor."""
+        hashed = hash_password(VALID_PASSWORD, rounds=4)
+        assert hashed.startswith("$2b$04$")
+        assert verify_password(VALID_PASSWORD, hashed) is True
+
+    def test_validate_bcrypt_rounds(self) -> None:
+        """Only costs bcrypt supports should be accepted."""
+        assert validate_bcrypt_rounds(4) == 4
+        assert validate_bcrypt_rounds(31) == 31
+        for rounds in (3, 32, 0, "12", True):
+            with pytest.raises(ValueError, match="between 4 and 31"):
+                validate_bcrypt_rounds(rounds)
+
 
 class TestVerifyPassword:
     """Tests for verify_password function."""
@@ -118,9 +141,79 @@ class TestVerifyPassword:
         """Empty hash should return False."""
         assert verify_password(VALID_PASSWORD, "") is False
 
+    def test_verify_accepts_bytes(self) -> None:
+        """Pre-encoded password and hash should verify like strings."""
+        hashed = hash_password(VALID_PASSWORD)
+        assert verify_password(VALID_PASSWORD.encode("utf-8"), hashed.encode("ascii")) is True
+        assert verify_password(b"Wrong@123", hashed) is False
+
     def test_verify_handles_unicode(self) -> None:
         """Should handle unicode passwords."""
         password = "Пароль@1Aa"
         hashed = hash_password(password)
         assert verify_password(password, hashed) is True
         assert verify_password("wrong", hashed) is False
+
+
+class TestNeedsRehash:
+    """Tests for hash cost inspection."""
+
+    def test_get_hash_rounds(self) -> None:
+        """Should read the cost factor from the hash."""
+        assert get_hash_rounds(hash_password(VALID_PASSWORD, rounds=5)) == 5
+
+    def test_get_hash_rounds_malformed(self) -> None:
+        """Malformed hashes should have no cost factor."""
+        assert get_hash_rounds("not-a-hash") is None
+
+    def test_needs_rehash_lower_cost(self) -> None:
+        """Hashes below the target cost should be upgraded."""
+        hashed = hash_password(VALID_PASSWORD, rounds=4)
+        assert needs_rehash(hashed, rounds=5)
+        assert not needs_rehash(hashed, rounds=4)
+
+    def test_needs_rehash_malformed(self) -> None:
+        """Malformed hashes should never be rehashed."""
+        assert not needs_rehash("not-a-hash", rounds=12)
+
+
+class TestVerifyCache:
+    """Tests for the successful-verification cache."""
+
+    @pytest.fixture
+    def checkpw_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+        """Count bcrypt.checkpw calls, starting from an empty cache."""
+        import bcrypt
+
+        calls: list[bytes] = []
+        checkpw = bcrypt.checkpw
+
+        def counting_checkpw(password: bytes, hashed_password: bytes) -> bool:
+            calls.append(password)
+            return checkpw(password, hashed_password)
+
+        clear_verify_cache()
+        monkeypatch.setattr(bcrypt, "checkpw", counting_checkpw)
+        return calls
+
+    def test_success_is_cached(self, checkpw_calls: list[bytes]) -> None:
+        """Repeated successful verifications should run bcrypt once."""
+        hashed = hash_password(VALID_PASSWORD, rounds=4)
+        assert verify_password(VALID_PASSWORD, hashed)
+        assert verify_password(VALID_PASSWORD, hashed)
+        assert len(checkpw_calls) == 1
+
+    def test_failure_is_not_cached(self, checkpw_calls: list[bytes]) -> None:
+        """Failed verifications should always pay the full bcrypt cost."""
+        hashed = hash_password(VALID_PASSWORD, rounds=4)
+        assert not verify_password("Wrong@123", hashed)
+        assert not verify_password("Wrong@123", hashed)
+        assert len(checkpw_calls) == 2
+
+    def test_cache_is_per_hash(self, checkpw_calls: list[bytes]) -> None:
+        """A cached match should not carry over to a different hash."""
+        hashed = hash_password(VALID_PASSWORD, rounds=4)
+        other = hash_password("Other@123", rounds=4)
+        assert verify_password(VALID_PASSWORD, hashed)
+        assert not verify_password(VALID_PASSWORD, other)
+        assert len(checkpw_calls) == 2
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
-
 from airflow_file_auth_manager.policy import FileAuthPolicy, Role
 
 
@@ -26,6 +24,10 @@ class TestRoleHierarchy:
         """Unknown role should have zero level."""
         assert FileAuthPolicy.get_role_level("unknown") == 0
 
+    def test_role_enum_level(self) -> None:
+        """Role members should resolve like their string values."""
+        assert FileAuthPolicy.get_role_level(Role.EDITOR) == 2
+
     def test_has_minimum_role_admin(self) -> None:
         """Admin should have all roles."""
         assert FileAuthPolicy.has_minimum_role("admin", Role.ADMIN)
@@ -86,6 +88,11 @@ class TestConnectionAuthorization:
         """Editor cannot modify connections."""
         assert not FileAuthPolicy.is_authorized_connection(method="POST", user_role="editor")
 
+    def test_unknown_method_denied(self) -> None:
+        """Methods outside the policy should be denied for every role."""
+        assert not FileAuthPolicy.is_authorized_connection(method="PATCH", user_role="admin")
+        assert not FileAuthPolicy.is_authorized_connection(method="PATCH", user_role="editor")
+
 
 class TestDagAuthorization:
     """Tests for Dag authorization."""
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import pytest
 import yaml
 
-from airflow_file_auth_manager.password import verify_password
-from airflow_file_auth_manager.user_store import UserStore
+from airflow_file_auth_manager import user_store as user_store_module
+from airflow_file_auth_manager.password import (
+    PasswordPolicyError,
+    clear_verify_cache,
+    get_hash_rounds,
+    verify_password,
+)
+from airflow_file_auth_manager.user_store import UserStore, _stat_key, clear_parse_cache
 
-from .conftest import TEST_PASSWORD_ADMIN, TEST_PASSWORD_EDITOR, TEST_PASSWORD_INACTIVE
-
-if TYPE_CHECKING:
-    pass
+from .conftest import TEST_PASSWORD_ADMIN, TEST_PASSWORD_INACTIVE, cached_hash_password
 
 # Valid test password that meets policy
 VALID_PASSWORD = "NewPass@123"
@@ -50,6 +55,279 @@ class TestUserStoreLoad:
         users = store.get_all_users()
         assert len(users) == 0
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_libyaml_bindings(self) -> None:
+        """The C loader and dumper should be used when libyaml is available."""
+        from airflow_file_auth_manager import user_store
+
+        assert user_store.SafeLoader is yaml.CSafeLoader
+        assert user_store.SafeDumper is yaml.CSafeDumper
+
+    def test_loaded_users_share_role_strings(self, users_file: Path) -> None:
+        """Users with the same role should share one role string."""
+        data = yaml.safe_load(users_file.read_text())
+        data["users"].append({**data["users"][-1], "username": "viewer2"})
+        users_file.write_text(yaml.dump(data))
+
+        store = UserStore(users_file)
+        assert store.get_user("viewer2").role is store.get_user("viewer").role
+
+    def test_reload_keeps_users_visible(
+        self, user_store: UserStore, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Users should stay readable while a reload parses the file."""
+        assert len(user_store.get_all_users()) == 4
+        read_users = UserStore._read_users
+        seen_during_parse = []
+
+        def observing_read_users(self, source_stat):
+            seen_during_parse.append(len(self._users))
+            return read_users(self, source_stat)
+
+        monkeypatch.setattr(UserStore, "_read_users", observing_read_users)
+        clear_parse_cache()
+        user_store.load()
+
+        assert seen_during_parse == [4]
+        assert len(user_store.get_all_users()) == 4
+
+    def test_load_null_metadata(self, users_file: Path) -> None:
+        """An entry with an empty metadata key should still load."""
+        data = yaml.safe_load(users_file.read_text())
+        data["users"][0]["metadata"] = None
+        users_file.write_text(yaml.dump(data))
+
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 4
+        assert store.get_user("admin").metadata is None
+
+    def test_load_scalar_metadata(self, users_file: Path) -> None:
+        """A non-mapping metadata value should not drop any user."""
+        data = yaml.safe_load(users_file.read_text())
+        data["users"][0]["metadata"] = "abc"
+        users_file.write_text(yaml.dump(data))
+
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 4
+        assert store.get_user("admin").metadata == "abc"
+
+    def test_load_skips_invalid_entries(self, users_file: Path) -> None:
+        """Invalid entries should be skipped without dropping valid ones."""
+        data = yaml.safe_load(users_file.read_text())
+        data["users"].append({"username": "broken", "role": "admin"})
+        data["users"].append({"username": "badrole", "password_hash": "x", "role": "root"})
+        users_file.write_text(yaml.safe_dump(data))
+
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 4
+        assert store.get_user("broken") is None
+
+    def test_load_skips_unhashable_role(self, users_file: Path) -> None:
+        """A list as role should skip that entry only."""
+        data = yaml.safe_load(users_file.read_text())
+        data["users"].append({"username": "listrole", "password_hash": "x", "role": ["admin"]})
+        users_file.write_text(yaml.safe_dump(data))
+
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 4
+        assert store.get_user("listrole") is None
+
+    def test_invalid_bcrypt_rounds_rejected(self, users_file: Path) -> None:
+        """An out-of-range cost should fail when the store is created."""
+        with pytest.raises(ValueError, match="between 4 and 31"):
+            UserStore(users_file, bcrypt_rounds=32)
+
+
+class TestUserStoreCache:
+    """Tests for the parsed-users JSON sidecar."""
+
+    def test_load_writes_cache(self, user_store: UserStore) -> None:
+        """Loading should create a private sidecar next to the users file."""
+        user_store.load()
+        assert user_store.cache_path.exists()
+        assert user_store.cache_path.stat().st_mode & 0o077 == 0
+
+    def test_load_uses_cache(
+        self, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fresh sidecar should be used instead of parsing YAML."""
+        UserStore(users_file).load()
+        clear_parse_cache()
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr("airflow_file_auth_manager.user_store.yaml.load", fail_load)
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 4
+
+    def test_stale_cache_ignored(self, users_file: Path) -> None:
+        """Changing the users file should invalidate the sidecar."""
+        UserStore(users_file).load()
+        data = yaml.safe_load(users_file.read_text())
+        data["users"] = data["users"][:1]
+        users_file.write_text(yaml.safe_dump(data))
+
+        store = UserStore(users_file)
+        assert len(store.get_all_users()) == 1
+
+    def test_replaced_file_with_same_mtime_ignored(self, users_file: Path) -> None:
+        """A file swapped in with the same size and mtime should not hit the cache."""
+        UserStore(users_file).load()
+        original = users_file.stat()
+        content = users_file.read_text().replace("role: viewer", "role: editor")
+        assert len(content) == len(users_file.read_text())
+
+        replacement = users_file.with_name("replacement.yaml")
+        replacement.write_text(content)
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, users_file)
+
+        store = UserStore(users_file)
+        assert store.get_user("viewer").role == "editor"
+
+    def test_save_refreshes_cache(
+        self, user_store: UserStore, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Saving should rewrite the sidecar for the new file version."""
+        user_store.add_user(username="saved", password=VALID_PASSWORD, role="viewer")
+        user_store.save()
+        assert user_store.cache_path.exists()
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        clear_parse_cache()
+        monkeypatch.setattr("airflow_file_auth_manager.user_store.yaml.load", fail_load)
+        assert UserStore(users_file).get_user("saved") is not None
+
+
+class TestUserStoreJson:
+    """Tests for JSON users files."""
+
+    def test_export_to_json(self, user_store: UserStore, temp_dir: Path) -> None:
+        """Exporting to a .json path should write JSON that loads back."""
+        json_file = temp_dir / "users.json"
+        user_store.export(json_file)
+
+        data = json.loads(json_file.read_text())
+        assert len(data["users"]) == 4
+
+        store = UserStore(json_file)
+        assert store.is_json
+        user = store.get_user("admin")
+        assert user is not None
+        assert user.password_hash == user_store.get_user("admin").password_hash
+
+    def test_json_authenticate(self, user_store: UserStore, temp_dir: Path) -> None:
+        """Users migrated to JSON should keep their passwords."""
+        json_file = temp_dir / "users.json"
+        user_store.export(json_file)
+        store = UserStore(json_file)
+        assert store.authenticate("admin", TEST_PASSWORD_ADMIN) is not None
+
+    def test_json_save_skips_cache(self, temp_dir: Path) -> None:
+        """JSON files should be saved as JSON without a sidecar."""
+        json_file = temp_dir / "users.json"
+        store = UserStore(json_file)
+        store.add_user(username="test", password=VALID_PASSWORD, role="viewer")
+        store.save()
+
+        new_store = UserStore(json_file)
+        assert new_store.get_user("test") is not None
+        assert not new_store.cache_path.exists()
+
+    def test_load_invalid_json(self, temp_dir: Path) -> None:
+        """Should handle invalid JSON."""
+        invalid_file = temp_dir / "invalid.json"
+        invalid_file.write_text("{ invalid json [")
+        store = UserStore(invalid_file)
+        assert len(store.get_all_users()) == 0
+
+
+class TestUserStoreParseCache:
+    """Tests for the process-wide parsed users cache."""
+
+    def test_unchanged_file_not_reread(
+        self, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second store on an unchanged file should reuse parsed users."""
+        UserStore(users_file).load()
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("users file should not be read")
+
+        monkeypatch.setattr(UserStore, "_read_users", fail_read)
+        assert len(UserStore(users_file).get_all_users()) == 4
+
+    def test_cached_users_are_copied(self, users_file: Path) -> None:
+        """Mutating one store's users should not leak into another."""
+        first = UserStore(users_file)
+        first.update_user("viewer", role="admin")
+        first.get_user("viewer").metadata["note"] = "changed"
+
+        second = UserStore(users_file)
+        assert second.get_user("viewer").role == "viewer"
+        assert "note" not in second.get_user("viewer").metadata
+
+    def test_hot_reload_detects_same_second_change(self, users_file: Path) -> None:
+        """A rewrite within the same second should still trigger a reload."""
+        store = UserStore(users_file)
+        store.load()
+        st = users_file.stat()
+
+        data = yaml.safe_load(users_file.read_text())
+        data["users"] = data["users"][:1]
+        users_file.write_text(yaml.safe_dump(data))
+        os.utime(users_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        store._next_check_ns = 0
+        assert len(store.get_all_users()) == 1
+
+
+class TestUserStoreWatch:
+    """Tests for filesystem-event based hot reload."""
+
+    def test_watch_reloads_on_change(self, users_file: Path) -> None:
+        """A rewrite should be picked up without waiting for the poll interval."""
+        pytest.importorskip("watchdog")
+        store = UserStore(users_file, watch=True)
+        try:
+            store.load()
+            assert store._observer is not None
+
+            data = yaml.safe_load(users_file.read_text())
+            data["users"] = data["users"][:1]
+            users_file.write_text(yaml.safe_dump(data))
+
+            assert store._changed.wait(timeout=5)
+            assert len(store.get_all_users()) == 1
+        finally:
+            store.close()
+
+    def test_watch_without_watchdog_polls(
+        self, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without watchdog the store should fall back to polling."""
+        monkeypatch.setitem(sys.modules, "watchdog.observers", None)
+        store = UserStore(users_file, watch=True)
+        store.load()
+        assert store._observer is None
+        assert len(store.get_all_users()) == 4
+
+    def test_symlinked_file_polls(self, users_file: Path) -> None:
+        """A symlinked users file should keep the short polling interval."""
+        pytest.importorskip("watchdog")
+        data_dir = users_file.parent / "..data"
+        data_dir.mkdir()
+        users_file.rename(data_dir / "users.yaml")
+        users_file.symlink_to(data_dir / "users.yaml")
+
+        store = UserStore(users_file, watch=True)
+        store.load()
+        assert store._observer is None
+        assert len(store.get_all_users()) == 4
+
 
 class TestUserStoreGetUser:
     """Tests for getting users."""
@@ -91,6 +369,85 @@ class TestUserStoreAuthenticate:
         user = user_store.authenticate("inactive", TEST_PASSWORD_INACTIVE)
         assert user is None
 
+    def test_authenticate_repeat_login_skips_bcrypt(
+        self, user_store: UserStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated successful logins should only run bcrypt once."""
+        import bcrypt
+
+        calls = []
+        checkpw = bcrypt.checkpw
+
+        def counting_checkpw(password: bytes, hashed_password: bytes) -> bool:
+            calls.append(password)
+            return checkpw(password, hashed_password)
+
+        clear_verify_cache()
+        monkeypatch.setattr(bcrypt, "checkpw", counting_checkpw)
+        assert user_store.authenticate("admin", TEST_PASSWORD_ADMIN) is not None
+        assert user_store.authenticate("admin", TEST_PASSWORD_ADMIN) is not None
+        assert user_store.authenticate("admin", "Wrong@Password1") is None
+        assert user_store.authenticate("admin", "Wrong@Password1") is None
+        assert len(calls) == 3
+
+    def test_authenticate_cache_invalidated_on_password_change(
+        self, user_store: UserStore
+    ) -> None:
+        """Old password should stop working once it is changed."""
+        assert user_store.authenticate("admin", TEST_PASSWORD_ADMIN) is not None
+        user_store.update_user("admin", password=VALID_PASSWORD)
+        assert user_store.authenticate("admin", TEST_PASSWORD_ADMIN) is None
+        assert user_store.authenticate("admin", VALID_PASSWORD) is not None
+
+    def test_authenticate_rehashes_low_cost_hash(self, temp_dir: Path) -> None:
+        """Low-cost hashes should be upgraded and saved after login."""
+        users_file = temp_dir / "users.yaml"
+        store = UserStore(users_file, bcrypt_rounds=4)
+        store.add_user(username="bulk", password=VALID_PASSWORD, role="viewer")
+        store.save()
+
+        store = UserStore(users_file, bcrypt_rounds=5, rehash_on_login=True)
+        assert store.authenticate("bulk", VALID_PASSWORD) is not None
+        assert get_hash_rounds(UserStore(users_file).get_user("bulk").password_hash) == 5
+
+    def test_rehash_keeps_external_edit(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file edit made while the new hash is computed should survive."""
+        users_file = temp_dir / "users.yaml"
+        store = UserStore(users_file, bcrypt_rounds=4)
+        store.add_user(username="bulk", password=VALID_PASSWORD, role="viewer")
+        store.add_user(username="other", password=VALID_PASSWORD, role="viewer")
+        store.save()
+
+        def hash_during_edit(
+            password: str, validate: bool = True, rounds: int | None = None
+        ) -> str:
+            data = yaml.safe_load(users_file.read_text())
+            data["users"] = [user for user in data["users"] if user["username"] != "other"]
+            users_file.write_text(yaml.safe_dump(data))
+            return cached_hash_password(password, validate, rounds)
+
+        store = UserStore(users_file, bcrypt_rounds=5, rehash_on_login=True)
+        store.load()
+        monkeypatch.setattr(user_store_module, "hash_password", hash_during_edit)
+        assert store.authenticate("bulk", VALID_PASSWORD) is not None
+
+        on_disk = UserStore(users_file)
+        assert on_disk.get_user("other") is None
+        assert get_hash_rounds(on_disk.get_user("bulk").password_hash) == 4
+
+    def test_authenticate_no_rehash_by_default(self, temp_dir: Path) -> None:
+        """Hashes should not be rewritten unless rehash_on_login is set."""
+        users_file = temp_dir / "users.yaml"
+        store = UserStore(users_file, bcrypt_rounds=4)
+        store.add_user(username="bulk", password=VALID_PASSWORD, role="viewer")
+        store.save()
+
+        store = UserStore(users_file, bcrypt_rounds=5)
+        assert store.authenticate("bulk", VALID_PASSWORD) is not None
+        assert get_hash_rounds(store.get_user("bulk").password_hash) == 4
+
 
 class TestUserStoreAddUser:
     """Tests for adding users."""
@@ -116,6 +473,54 @@ class TestUserStoreAddUser:
                 role="admin",
             )
 
+    def test_add_users(self, users_file: Path) -> None:
+        """Should add every user with a verifiable hash."""
+        store = UserStore(users_file, bcrypt_rounds=4)
+        created = store.add_users(
+            {"username": f"bulk{i}", "password": VALID_PASSWORD, "role": "viewer"}
+            for i in range(4)
+        )
+
+        assert [user.username for user in created] == ["bulk0", "bulk1", "bulk2", "bulk3"]
+        assert store.dirty
+        for user in created:
+            assert store.get_user(user.username) is user
+            assert get_hash_rounds(user.password_hash) == 4
+            assert verify_password(VALID_PASSWORD, user.password_hash)
+
+    def test_add_users_is_all_or_nothing(self, users_file: Path) -> None:
+        """A duplicate or invalid entry should leave the store unchanged."""
+        store = UserStore(users_file, bcrypt_rounds=4)
+        before = len(store.get_all_users())
+
+        with pytest.raises(ValueError, match="already exists"):
+            store.add_users([
+                {"username": "bulk", "password": VALID_PASSWORD, "role": "viewer"},
+                {"username": "admin", "password": VALID_PASSWORD, "role": "viewer"},
+            ])
+        with pytest.raises(ValueError, match="Invalid role"):
+            store.add_users([
+                {"username": "bulk", "password": VALID_PASSWORD, "role": "viewer"},
+                {"username": "bad", "password": VALID_PASSWORD, "role": "root"},
+            ])
+        with pytest.raises(PasswordPolicyError):
+            store.add_users([
+                {"username": "bulk", "password": VALID_PASSWORD, "role": "viewer"},
+                {"username": "weak", "password": "short", "role": "viewer"},
+            ])
+        with pytest.raises(ValueError, match="Invalid password"):
+            store.add_users([{"username": "nonstr", "password": 12345678, "role": "viewer"}])
+
+        with pytest.raises(ValueError, match="Missing fields"):
+            store.add_users([{"username": "nopass", "role": "viewer"}])
+        with pytest.raises(ValueError, match="Unknown fields"):
+            store.add_users([
+                {"username": "extra", "password": VALID_PASSWORD, "role": "viewer", "nickname": "x"},
+            ])
+
+        assert len(store.get_all_users()) == before
+        assert not store.dirty
+
     def test_add_user_invalid_role(self, user_store: UserStore) -> None:
         """Should raise error for invalid role."""
         with pytest.raises(ValueError, match="Invalid role"):
@@ -134,6 +539,12 @@ class TestUserStoreUpdateUser:
         user = user_store.update_user("editor", role="admin")
         assert user.role == "admin"
 
+    def test_update_user_role_is_canonical(self, user_store: UserStore) -> None:
+        """Should store the shared role string, not the caller's copy."""
+        role = "".join(["ad", "min"])
+        user = user_store.update_user("editor", role=role)
+        assert user.role is user_store.get_user("admin").role
+
     def test_update_user_password(self, user_store: UserStore) -> None:
         """Should update user password."""
         user_store.update_user("editor", password=VALID_PASSWORD)
@@ -191,6 +602,99 @@ class TestUserStoreSave:
         store.save()
         assert nested_file.exists()
 
+    def test_save_preserves_mode(self, user_store: UserStore, users_file: Path) -> None:
+        """Saving should keep the existing file's permissions."""
+        users_file.chmod(0o640)
+        user_store.save()
+        assert users_file.stat().st_mode & 0o777 == 0o640
+
+    def test_save_new_file_is_private(self, temp_dir: Path) -> None:
+        """A newly created users file should be readable by its owner only."""
+        store = UserStore(temp_dir / "new.yaml")
+        store.save()
+        assert (temp_dir / "new.yaml").stat().st_mode & 0o777 == 0o600
+
+    def test_save_records_file_version(self, user_store: UserStore, users_file: Path) -> None:
+        """A save should not look like an external change to hot reload."""
+        user_store.save()
+        assert user_store._last_stat_key == _stat_key(users_file.stat())
+
+    def test_unchanged_save_skips_write(self, user_store: UserStore, users_file: Path) -> None:
+        """Saving the same content twice should not rewrite the file."""
+        user_store.update_user("viewer", role="editor")
+        user_store.save()
+        inode = users_file.stat().st_ino
+
+        user_store.update_user("viewer", role="editor")
+        user_store.save()
+
+        assert users_file.stat().st_ino == inode
+
+    def test_save_after_external_change_writes(self, user_store: UserStore, users_file: Path) -> None:
+        """A save should not be skipped once the file changed on disk."""
+        user_store.update_user("viewer", role="editor")
+        user_store.save()
+        saved = users_file.read_bytes()
+        users = user_store.get_all_users()
+        users_file.write_text("version: '1.0'\nusers: []\n")
+        user_store.load()
+
+        for user in users:
+            user_store._users[user.username] = user
+        user_store.save()
+
+        assert users_file.read_bytes() == saved
+
+    def test_batch_saves_once(
+        self, user_store: UserStore, users_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Mutations inside batch() should be written by a single save."""
+        saves = []
+        save = UserStore.save
+        monkeypatch.setattr(UserStore, "save", lambda self: (saves.append(1), save(self)))
+
+        with user_store.batch():
+            user_store.add_user(username="one", password=VALID_PASSWORD, role="viewer")
+            user_store.add_user(username="two", password=VALID_PASSWORD, role="viewer")
+            user_store.delete_user("viewer")
+
+        assert len(saves) == 1
+        assert not user_store.dirty
+        new_store = UserStore(users_file)
+        assert new_store.get_user("two") is not None
+        assert new_store.get_user("viewer") is None
+
+    def test_batch_skips_save_on_error(self, user_store: UserStore, users_file: Path) -> None:
+        """A failing batch should be rolled back and leave the file untouched."""
+        with pytest.raises(ValueError), user_store.batch():
+            user_store.add_user(username="one", password=VALID_PASSWORD, role="viewer")
+            user_store.update_user("viewer", role="admin")
+            user_store.delete_user("nonexistent")
+
+        assert not user_store.dirty
+        assert user_store.get_user("one") is None
+        assert user_store.get_user("viewer").role == "viewer"
+        user_store.save()
+        assert UserStore(users_file).get_user("one") is None
+
+    def test_batch_survives_external_change(self, user_store: UserStore, users_file: Path) -> None:
+        """A file rewrite mid-batch should not discard the batch's changes."""
+        st = users_file.stat()
+        with user_store.batch():
+            user_store.add_user(username="one", password=VALID_PASSWORD, role="viewer")
+
+            data = yaml.safe_load(users_file.read_text())
+            data["users"] = data["users"][:1]
+            users_file.write_text(yaml.safe_dump(data))
+            os.utime(users_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+            user_store._next_check_ns = 0
+
+            user_store.add_user(username="two", password=VALID_PASSWORD, role="viewer")
+
+        new_store = UserStore(users_file)
+        assert new_store.get_user("one") is not None
+        assert new_store.get_user("two") is not None
+
     def test_save_atomic_write(self, user_store: UserStore, users_file: Path) -> None:
         """Saved file should have secure permissions."""
         user_store.save()